@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import copy
 import re
-from dataclasses import dataclass
-from typing import Any, Generic, NamedTuple, TypeVar
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Generic, Literal, NamedTuple, TypeVar
 
 from gameinsights.exceptions import (
     GameInsightsError,
@@ -13,9 +15,35 @@ from gameinsights.exceptions import (
 )
 
 SourceT = TypeVar("SourceT", covariant=True)
+ErrorKind = Literal["not_found", "unavailable", "other"]
+
+# Patterns used by classify_source_error, compiled once at import time since
+# classification sits on the per-source error path of every batch.
+_APPID_RE = re.compile(r"appid\s+(\S+)")
+_STEAMID_RE = re.compile(r"steamid\s+(\S+)")
+_HTTP_ERROR_STATUS_RE = re.compile(r"status(?:\s+code)?:?\s*[45]\d{2}")
+_NETWORK_KEYWORDS = (
+    "status code: 599",
+    "failed to connect",
+    "connection",
+    "timeout",
+    "ssl",
+    "toomanyredirects",
+)
+# One alternation so network errors are detected in a single pass over the message.
+_NETWORK_ERROR_RE = re.compile("|".join(map(re.escape, _NETWORK_KEYWORDS)))
+_SOURCE_FAILURE_RE = re.compile(r"failed to (?:parse|fetch|obtain)")
+# Every check that maps to SourceUnavailableError, fused so the common errors
+# (timeouts, 5xx, fetch/parse failures) are all recognised in one scan.
+_UNAVAILABLE_RE = re.compile(
+    "|".join(
+        pattern.pattern
+        for pattern in (_SOURCE_FAILURE_RE, _NETWORK_ERROR_RE, _HTTP_ERROR_STATUS_RE)
+    )
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchResult:
     """Result of fetching data for a single game/user."""
 
@@ -27,10 +55,75 @@ class FetchResult:
 
 class _SourceConfig(NamedTuple, Generic[SourceT]):
     source: SourceT
-    fields: list[str]
+    fields: tuple[str, ...]
     is_primary: bool = False
 
 
+# Fields each source contributes to GameDataModel. Shared by every Collector and
+# AsyncCollector instance instead of being rebuilt per construction.
+STEAMSTORE_FIELDS = (
+    "steam_appid",
+    "name",
+    "developers",
+    "publishers",
+    "type",
+    "price_currency",
+    "price_initial",
+    "price_final",
+    "categories",
+    "platforms",
+    "genres",
+    "metacritic_score",
+    "release_date",
+    "content_rating",
+    "is_free",
+    "is_coming_soon",
+    "recommendations",
+)
+STEAMSPY_FIELDS = ("ccu", "tags", "discount", "average_playtime_min", "languages")
+STEAMCHARTS_FIELDS = ("active_player_24h", "peak_active_player_all_time", "monthly_active_player")
+STEAMREVIEW_FIELDS = (
+    "review_score",
+    "review_score_desc",
+    "total_positive",
+    "total_negative",
+    "total_reviews",
+)
+STEAMACHIEVEMENTS_FIELDS = (
+    "achievements_count",
+    "achievements_percentage_average",
+    "achievements_list",
+)
+PROTONDB_FIELDS = (
+    "protondb_tier",
+    "protondb_score",
+    "protondb_trending",
+    "protondb_confidence",
+    "protondb_total",
+)
+HOWLONGTOBEAT_FIELDS = (
+    "comp_main",
+    "comp_plus",
+    "comp_100",
+    "comp_all",
+    "comp_main_count",
+    "comp_plus_count",
+    "comp_100_count",
+    "comp_all_count",
+    "invested_co",
+    "invested_mp",
+    "invested_co_count",
+    "invested_mp_count",
+    "count_comp",
+    "count_speed_run",
+    "count_backlog",
+    "count_review",
+    "review_score",
+    "count_playing",
+    "count_retired",
+)
+
+
 def post_process_raw_data(raw_data: dict[str, Any], boxleiter_multiplier: int) -> None:
     """Derive fields that depend on aggregated data from multiple sources.
 
@@ -79,43 +172,42 @@ def classify_source_error(source_name: str, error_message: str) -> GameInsightsE
     Returns:
         Appropriate exception instance based on error classification
     """
-    lowered = error_message.lower()
+    kind, identifier_hint = _classify_error_message(error_message)
 
-    if "not available in the specified region" in lowered:
-        match = re.search(r"appid\s+(\S+)", lowered)
-        identifier_hint = match.group(1).rstrip(".,") if match else "unknown"
+    if kind == "not_found":
         return GameNotFoundError(identifier=identifier_hint, message=error_message)
-
-    if "failed to parse" in lowered:
+    if kind == "unavailable":
         return SourceUnavailableError(source=source_name, reason=error_message)
+    return GameInsightsError(error_message)
 
-    if "failed to fetch" in lowered or "failed to obtain" in lowered:
-        return SourceUnavailableError(source=source_name, reason=error_message)
 
-    network_keywords = [
-        "status code: 599",
-        "failed to connect",
-        "connection",
-        "timeout",
-        "ssl",
-        "toomanyredirects",
-    ]
-    if any(keyword in lowered for keyword in network_keywords):
-        return SourceUnavailableError(source=source_name, reason=error_message)
+@lru_cache(maxsize=512)
+def _classify_error_message(error_message: str) -> tuple[ErrorKind, str]:
+    """Classify a raw error string into an error kind and identifier hint.
 
-    if re.search(r"status(?:\s+code)?:?\s*[45]\d{2}", lowered):
-        return SourceUnavailableError(source=source_name, reason=error_message)
+    Cached because the same upstream messages (timeouts, 503s) recur across a
+    batch. Only the classification is cached, never exception instances, so
+    every caller still raises a fresh exception with its own traceback.
+    """
+    lowered = error_message.lower()
+
+    if "not available in the specified region" in lowered:
+        match = _APPID_RE.search(lowered)
+        return "not_found", match.group(1).rstrip(".,") if match else "unknown"
+
+    if _UNAVAILABLE_RE.search(lowered):
+        return "unavailable", ""
 
     if "not found" in lowered:
         identifier_hint = "unknown"
-        for pattern in [r"appid\s+(\S+)", r"steamid\s+(\S+)"]:
-            match = re.search(pattern, lowered)
+        for pattern in (_APPID_RE, _STEAMID_RE):
+            match = pattern.search(lowered)
             if match:
                 identifier_hint = match.group(1).rstrip(".,")
                 break
-        return GameNotFoundError(identifier=identifier_hint, message=error_message)
+        return "not_found", identifier_hint
 
-    return GameInsightsError(error_message)
+    return "other", ""
 
 
 def raise_for_fetch_failure(
@@ -160,20 +252,21 @@ def record_fetch_outcome(
     """Record metrics and log the outcome of a source fetch."""
     from gameinsights.utils import metrics
 
-    duration_ms = round(timing.duration * 1000, 2)
-    metrics.counter("source_fetch_total", source=source_name, scope=scope)
-    if success:
-        metrics.counter("source_fetch_success_total", source=source_name, scope=scope)
-    else:
-        metrics.counter("source_fetch_error_total", source=source_name, scope=scope)
-    logger.log_event(
-        "source_fetch_complete",
-        verbose=verbose,
-        scope=scope,
-        identifier=identifier,
-        success=success,
-        duration_ms=duration_ms,
-    )
+    if metrics.enabled:
+        metrics.counter("source_fetch_total", source=source_name, scope=scope)
+        if success:
+            metrics.counter("source_fetch_success_total", source=source_name, scope=scope)
+        else:
+            metrics.counter("source_fetch_error_total", source=source_name, scope=scope)
+    if verbose:
+        logger.log_event(
+            "source_fetch_complete",
+            verbose=verbose,
+            scope=scope,
+            identifier=identifier,
+            success=success,
+            duration_ms=round(timing.duration * 1000, 2),
+        )
 
 
 def record_fetch_exception(
@@ -186,7 +279,8 @@ def record_fetch_exception(
     """Record metrics and log for a source fetch exception."""
     from gameinsights.utils import metrics
 
-    metrics.counter("source_fetch_exception_total", source=source_name, scope=scope)
+    if metrics.enabled:
+        metrics.counter("source_fetch_exception_total", source=source_name, scope=scope)
     logger.log_event(
         "source_fetch_exception",
         level="error",
@@ -197,6 +291,39 @@ def record_fetch_exception(
     )
 
 
+def expand_duplicate_results(
+    steam_appids: list[str], unique_results: list[FetchResult]
+) -> list[FetchResult]:
+    """Map results fetched for the distinct appids back onto the original list.
+
+    ``unique_results`` is in first-occurrence order of ``steam_appids``. Repeated
+    appids get their own deep copy of the data so callers can mutate rows freely.
+    """
+    by_appid = dict(zip(dict.fromkeys(steam_appids), unique_results))
+    expanded: list[FetchResult] = []
+    seen: set[str] = set()
+    for appid in steam_appids:
+        result = by_appid[appid]
+        if appid in seen:
+            result = replace(result, data=copy.deepcopy(result.data))
+        else:
+            seen.add(appid)
+        expanded.append(result)
+    return expanded
+
+
+def active_player_columns(all_months: set[str]) -> tuple[list[str], list[str], list[str]]:
+    """Return the column layout for active-player data.
+
+    Returns:
+        (sorted_months, fixed_columns, numeric_columns)
+    """
+    sorted_months = sorted(all_months)
+    fixed_columns = ["steam_appid", "name", "peak_active_player_all_time"]
+    numeric_columns = ["peak_active_player_all_time"] + sorted_months
+    return sorted_months, fixed_columns, numeric_columns
+
+
 def normalize_active_player_rows(
     all_data: list[dict[str, Any]],
     all_months: set[str],
@@ -207,9 +334,7 @@ def normalize_active_player_rows(
     Returns:
         (normalized_data, sorted_months, fixed_columns, numeric_columns)
     """
-    sorted_months = sorted(all_months)
-    fixed_columns = ["steam_appid", "name", "peak_active_player_all_time"]
-    numeric_columns = ["peak_active_player_all_time"] + sorted_months
+    sorted_months, fixed_columns, numeric_columns = active_player_columns(all_months)
 
     normalized_data: list[dict[str, Any]] = []
     for record in all_data:
@@ -223,3 +348,29 @@ def normalize_active_player_rows(
         normalized_data.append(normalized_record)
 
     return normalized_data, sorted_months, fixed_columns, numeric_columns
+
+
+def build_active_player_frame(
+    pd: Any,
+    all_data: list[dict[str, Any]],
+    all_months: set[str],
+    fill_na_as: int = -1,
+) -> Any:
+    """Build the active-player DataFrame directly from the raw game records.
+
+    Missing numbers are filled while the rows are built, before pandas infers the
+    column dtypes, so the frame matches the normalized list output (int fills keep
+    int columns, float fills give float columns). Rows are plain lists rather than
+    per-record dicts.
+    """
+    sorted_months, fixed_columns, numeric_columns = active_player_columns(all_months)
+
+    rows = [
+        [record.get("steam_appid"), record.get("name")]
+        + [fill_na_as if (value := record.get(col)) is None else value for col in numeric_columns]
+        for record in all_data
+    ]
+    df = pd.DataFrame(rows, columns=fixed_columns + sorted_months)
+    # NaN values coming from the sources are filled the same way as missing ones.
+    df[numeric_columns] = df[numeric_columns].fillna(fill_na_as)
+    return df
@@ -3,14 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import json as json_module
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
-from urllib.parse import urljoin
 
 import aiohttp
-from fake_useragent import UserAgent
 
 from gameinsights._types import HttpMethod
 from gameinsights.sources._helpers import (
@@ -19,12 +16,18 @@ from gameinsights.sources._helpers import (
 from gameinsights.sources._helpers import (
     build_error_result as _build_error_result,
 )
+from gameinsights.sources._helpers import (
+    build_request_url as _build_request_url,
+)
 from gameinsights.sources._helpers import (
     fetch_and_parse_json as _fetch_and_parse_json,
 )
 from gameinsights.sources._helpers import (
     filter_valid_labels as _filter_valid_labels,
 )
+from gameinsights.sources._helpers import (
+    loads_json,
+)
 from gameinsights.sources._helpers import (
     prepare_identifier as _prepare_identifier,
 )
@@ -34,6 +37,7 @@ from gameinsights.sources.base import (
     SourceResult,
 )
 from gameinsights.utils import LoggerWrapper
+from gameinsights.utils.useragent import random_user_agent
 
 
 @dataclass
@@ -51,7 +55,7 @@ class _AsyncResponse:
     reason: str = ""
 
     def json(self) -> Any:
-        return json_module.loads(self._body)
+        return loads_json(self._body)
 
     @property
     def text(self) -> str:
@@ -74,7 +78,6 @@ class AsyncBaseSource(ABC):
     def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
         self._logger = LoggerWrapper(self.__class__.__name__)
         self._session = session
-        self._ua = UserAgent()
 
     @property
     def logger(self) -> LoggerWrapper:
@@ -120,15 +123,13 @@ class AsyncBaseSource(ABC):
         Never raises.
         """
         source_url = url if url else self._base_url
-        final_url = source_url.rstrip("/")  # type: ignore[union-attr]
-        if endpoint:
-            final_url = urljoin(final_url + "/", endpoint.rstrip("/"))
+        final_url = _build_request_url(source_url, endpoint)  # type: ignore[arg-type]
 
         if headers is None:
-            headers = {"User-Agent": self._ua.random}
+            headers = {"User-Agent": random_user_agent()}
         elif "User-Agent" not in headers:
             headers = headers.copy()
-            headers["User-Agent"] = self._ua.random
+            headers["User-Agent"] = random_user_agent()
 
         if isinstance(timeout, tuple):
             connect_t, total_t = timeout
@@ -1,17 +1,26 @@
+import asyncio
 import json
+import time
 from typing import Any, cast
 
 import aiohttp
 
 from gameinsights.async_.base import AsyncBaseSource, _AsyncResponse
+from gameinsights.sources._helpers import loads_json
 from gameinsights.sources._parsers import (
     extract_hltb_game_data,
     generate_search_payload,
     transform_howlongtobeat,
 )
-from gameinsights.sources._schemas import _HOWLONGTOBEAT_LABELS, _SearchAuth
+from gameinsights.sources._schemas import (
+    _HLTB_AUTH_REJECTED_STATUSES,
+    _HLTB_SEARCH_AUTH_TTL,
+    _HOWLONGTOBEAT_LABELS,
+    _SearchAuth,
+)
 from gameinsights.sources.base import SYNTHETIC_ERROR_CODE, SourceResult, SuccessResult
 from gameinsights.utils.async_ratelimit import async_rate_limited
+from gameinsights.utils.useragent import random_user_agent
 
 
 class AsyncHowLongToBeat(AsyncBaseSource):
@@ -22,6 +31,9 @@ class AsyncHowLongToBeat(AsyncBaseSource):
 
     def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
         super().__init__(session=session)
+        self._search_auth: _SearchAuth | None = None
+        self._search_auth_expires_at = 0.0
+        self._search_auth_lock = asyncio.Lock()
 
     @async_rate_limited(calls=60, period=60)
     async def fetch(
@@ -36,18 +48,26 @@ class AsyncHowLongToBeat(AsyncBaseSource):
             verbose=verbose,
         )
 
-        # Step 1: Get session auth (token + dynamic params)
-        auth = await self._get_search_auth()
+        # Step 1: Get session auth (token + dynamic params), reused across fetches
+        auth = await self._get_cached_search_auth()
         if not auth:
             return self._build_error_result("Failed to obtain search token.", verbose=verbose)
 
         # Step 2: Search for the game
         search_response = await self._fetch_search_results(game_name, auth)
+        if search_response is not None and (
+            search_response.status_code in _HLTB_AUTH_REJECTED_STATUSES
+        ):
+            # The cached auth was revoked server-side; refresh it and retry once.
+            auth = await self._get_cached_search_auth(refresh=True)
+            if not auth:
+                return self._build_error_result("Failed to obtain search token.", verbose=verbose)
+            search_response = await self._fetch_search_results(game_name, auth)
         if not search_response:
             return self._build_error_result("Failed to fetch data.", verbose=verbose)
 
         try:
-            search_result = cast(dict[str, Any], json.loads(search_response.text))
+            search_result = cast(dict[str, Any], loads_json(search_response.text))
         except json.JSONDecodeError:
             return self._build_error_result("Failed to parse search response.", verbose=verbose)
 
@@ -83,8 +103,20 @@ class AsyncHowLongToBeat(AsyncBaseSource):
 
         return SuccessResult(success=True, data=data_packed)
 
+    async def _get_cached_search_auth(self, refresh: bool = False) -> _SearchAuth | None:
+        """Return the cached search auth, fetching a new one when missing or expired."""
+        async with self._search_auth_lock:
+            if (
+                refresh
+                or self._search_auth is None
+                or time.monotonic() >= self._search_auth_expires_at
+            ):
+                self._search_auth = await self._get_search_auth()
+                self._search_auth_expires_at = time.monotonic() + _HLTB_SEARCH_AUTH_TTL
+            return self._search_auth
+
     async def _get_search_auth(self) -> _SearchAuth | None:
-        ua = self._ua.random
+        ua = random_user_agent()
         headers = {
             "Accept": "*/*",
             "Referer": self.REFERER_HEADER,
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import aiohttp
 
 from gameinsights._collector_utils import (
+    HOWLONGTOBEAT_FIELDS,
+    PROTONDB_FIELDS,
+    STEAMACHIEVEMENTS_FIELDS,
+    STEAMCHARTS_FIELDS,
+    STEAMREVIEW_FIELDS,
+    STEAMSPY_FIELDS,
+    STEAMSTORE_FIELDS,
     FetchResult,
     _SourceConfig,
+    build_active_player_frame,
     classify_source_error,
     normalize_active_player_rows,
     post_process_raw_data,
@@ -30,7 +39,7 @@ from gameinsights.exceptions import (
     GameInsightsError,
     InvalidRequestError,
 )
-from gameinsights.model.game_data import GameDataModel
+from gameinsights.model.game_data import GameDataModel, pinned_today
 from gameinsights.sources.base import SourceResult
 from gameinsights.utils import LoggerWrapper, metrics
 from gameinsights.utils.async_ratelimit import async_rate_limited
@@ -41,6 +50,8 @@ if TYPE_CHECKING:
 
 AsyncSourceConfig = _SourceConfig[AsyncBaseSource]
 
+T = TypeVar("T")
+
 
 class AsyncCollector:
     """Async collector for Steam game data from multiple sources.
@@ -55,6 +66,10 @@ class AsyncCollector:
         await collector._ensure_initialized()
         data = await collector.get_games_data(["570"])
         await collector.close()
+
+    Sources of one game are always fetched concurrently. Pass ``max_concurrency``
+    to also fetch several appids at once; the default of 1, like Collector, runs
+    one game at a time.
     """
 
     _session: aiohttp.ClientSession | None
@@ -68,13 +83,17 @@ class AsyncCollector:
         boxleiter_multiplier: int = 30,
         calls: int = 60,
         period: int = 60,
+        max_concurrency: int = 1,
     ) -> None:
+        if max_concurrency < 1:
+            raise InvalidRequestError("max_concurrency must be at least 1.")
         self._region = region
         self._language = language
         self._steam_api_key = steam_api_key
         self._boxleiter_multiplier = boxleiter_multiplier
         self.calls = calls
         self.period = period
+        self.max_concurrency = max_concurrency
         self._session = None
         self._initialized = False
         self._logger = LoggerWrapper(self.__class__.__name__)
@@ -88,8 +107,10 @@ class AsyncCollector:
         if self._initialized:
             return
 
+        # limit_per_host is the real politeness cap; the global limit only needs to
+        # cover max_concurrency games x every source host without queueing.
         self._session = aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(limit=20, limit_per_host=10)
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
         )
         self._init_sources()
         self._init_sources_config()
@@ -118,92 +139,16 @@ class AsyncCollector:
 
     def _init_sources_config(self) -> None:
         self._id_based_sources: list[AsyncSourceConfig] = [
-            AsyncSourceConfig(
-                self.steamstore,
-                [
-                    "steam_appid",
-                    "name",
-                    "developers",
-                    "publishers",
-                    "type",
-                    "price_currency",
-                    "price_initial",
-                    "price_final",
-                    "categories",
-                    "platforms",
-                    "genres",
-                    "metacritic_score",
-                    "release_date",
-                    "content_rating",
-                    "is_free",
-                    "is_coming_soon",
-                    "recommendations",
-                ],
-                is_primary=True,
-            ),
-            AsyncSourceConfig(
-                self.steamspy,
-                ["ccu", "tags", "discount", "average_playtime_min", "languages"],
-            ),
-            AsyncSourceConfig(
-                self.steamcharts,
-                ["active_player_24h", "peak_active_player_all_time", "monthly_active_player"],
-            ),
-            AsyncSourceConfig(
-                self.steamreview,
-                [
-                    "review_score",
-                    "review_score_desc",
-                    "total_positive",
-                    "total_negative",
-                    "total_reviews",
-                ],
-            ),
-            AsyncSourceConfig(
-                self.steamachievements,
-                [
-                    "achievements_count",
-                    "achievements_percentage_average",
-                    "achievements_list",
-                ],
-            ),
-            AsyncSourceConfig(
-                self.protondb,
-                [
-                    "protondb_tier",
-                    "protondb_score",
-                    "protondb_trending",
-                    "protondb_confidence",
-                    "protondb_total",
-                ],
-            ),
+            AsyncSourceConfig(self.steamstore, STEAMSTORE_FIELDS, is_primary=True),
+            AsyncSourceConfig(self.steamspy, STEAMSPY_FIELDS),
+            AsyncSourceConfig(self.steamcharts, STEAMCHARTS_FIELDS),
+            AsyncSourceConfig(self.steamreview, STEAMREVIEW_FIELDS),
+            AsyncSourceConfig(self.steamachievements, STEAMACHIEVEMENTS_FIELDS),
+            AsyncSourceConfig(self.protondb, PROTONDB_FIELDS),
         ]
 
         self._name_based_sources: list[AsyncSourceConfig] = [
-            AsyncSourceConfig(
-                self.howlongtobeat,
-                [
-                    "comp_main",
-                    "comp_plus",
-                    "comp_100",
-                    "comp_all",
-                    "comp_main_count",
-                    "comp_plus_count",
-                    "comp_100_count",
-                    "comp_all_count",
-                    "invested_co",
-                    "invested_mp",
-                    "invested_co_count",
-                    "invested_mp_count",
-                    "count_comp",
-                    "count_speed_run",
-                    "count_backlog",
-                    "count_review",
-                    "review_score",
-                    "count_playing",
-                    "count_retired",
-                ],
-            ),
+            AsyncSourceConfig(self.howlongtobeat, HOWLONGTOBEAT_FIELDS),
         ]
 
     @async_rate_limited()
@@ -309,8 +254,10 @@ class AsyncCollector:
     ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], list[FetchResult]]:
         """Fetch game data for one or more appids.
 
-        Parallelism is per-source within a game (via asyncio.gather in _fetch_raw_data).
-        Games are processed sequentially to avoid over-calling sources.
+        Parallelism is per-source within a game (via asyncio.gather in _fetch_raw_data)
+        and across games: up to ``max_concurrency`` appids are in flight at once, while
+        the rate limiter on _fetch_raw_data still bounds the overall call rate.
+        Results are returned in input order.
         """
         await self._ensure_initialized()
 
@@ -320,32 +267,41 @@ class AsyncCollector:
         if isinstance(steam_appids, (str, int)):
             steam_appids = [steam_appids]
 
-        result: list[dict[str, Any]] = []
-        all_results: list[FetchResult] = []
         total = len(steam_appids)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        for idx, appid in enumerate(steam_appids, start=1):
-            self.logger.log(
-                f"Fetching {idx} of {total} game data: steam appid {appid}..",
-                level="info",
-                verbose=verbose,
-            )
-            try:
-                game_data = await self._fetch_raw_data(
+        async def fetch_one(idx: int, appid: str) -> FetchResult:
+            async with semaphore:
+                self.logger.log(
+                    "Fetching %d of %d game data: steam appid %s..",
+                    idx,
+                    total,
                     appid,
+                    level="info",
                     verbose=verbose,
-                    raise_on_primary_failure=raise_on_error,
                 )
+                try:
+                    game_data = await self._fetch_raw_data(
+                        appid,
+                        verbose=verbose,
+                        raise_on_primary_failure=raise_on_error,
+                    )
+                except GameInsightsError as e:
+                    if raise_on_error:
+                        raise
+                    self.logger.log(
+                        f"Error fetching data for game {appid}: {e}", level="error", verbose=True
+                    )
+                    return FetchResult(identifier=str(appid), success=False, error=str(e))
                 payload = game_data.get_recap() if recap else game_data.model_dump(mode="json")
-                result.append(payload)
-                all_results.append(FetchResult(identifier=str(appid), success=True, data=payload))
-            except GameInsightsError as e:
-                if raise_on_error:
-                    raise
-                self.logger.log(
-                    f"Error fetching data for game {appid}: {e}", level="error", verbose=True
-                )
-                all_results.append(FetchResult(identifier=str(appid), success=False, error=str(e)))
+                return FetchResult(identifier=str(appid), success=True, data=payload)
+
+        # Tasks copy the current context on creation, so every game sees the pinned date.
+        with pinned_today():
+            all_results = await self._gather_in_order(
+                [fetch_one(idx, appid) for idx, appid in enumerate(steam_appids, start=1)]
+            )
+        result = [r.data for r in all_results if r.success and r.data is not None]
 
         if include_failures:
             return result, all_results
@@ -378,75 +334,77 @@ class AsyncCollector:
             steam_appids = [steam_appids]
 
         all_months: set[str] = set()
-        all_data: list[dict[str, Any]] = []
-        all_results: list[FetchResult] = []
         total = len(steam_appids)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        for idx, appid in enumerate(steam_appids, start=1):
-            self.logger.log(
-                f"Fetching {idx} of {total}: active player data for appid {appid}..",
-                level="info",
-                verbose=verbose,
-            )
-            game_record: dict[str, Any] = {"steam_appid": appid}
-
-            try:
-                active_player_data = await self.steamcharts.fetch(
+        async def fetch_one(idx: int, appid: str) -> tuple[dict[str, Any], FetchResult]:
+            async with semaphore:
+                self.logger.log(
+                    "Fetching %d of %d: active player data for appid %s..",
+                    idx,
+                    total,
                     appid,
+                    level="info",
                     verbose=verbose,
-                    selected_labels=[
-                        "name",
-                        "peak_active_player_all_time",
-                        "monthly_active_player",
-                    ],
                 )
-
-                if active_player_data["success"]:
-                    src_data = active_player_data["data"]
-                    monthly_data = {
-                        month["month"]: month["average_players"]
-                        for month in src_data.get("monthly_active_player", [])
-                    }
-                    game_record.update(monthly_data)
-                    game_record.update(
-                        {
-                            "name": src_data.get("name"),
-                            "peak_active_player_all_time": src_data.get(
-                                "peak_active_player_all_time"
-                            ),
-                        }
+                game_record: dict[str, Any] = {"steam_appid": appid}
+
+                try:
+                    active_player_data = await self.steamcharts.fetch(
+                        appid,
+                        verbose=verbose,
+                        selected_labels=[
+                            "name",
+                            "peak_active_player_all_time",
+                            "monthly_active_player",
+                        ],
                     )
-                    all_months.update(monthly_data.keys())
-                    all_results.append(
-                        FetchResult(identifier=str(appid), success=True, data=game_record.copy())
+                except Exception as e:
+                    self.logger.log(
+                        f"Error fetching active player data for appid {appid}: {e}",
+                        level="error",
+                        verbose=True,
                     )
-                else:
-                    all_results.append(
-                        FetchResult(
-                            identifier=str(appid),
-                            success=False,
-                            error=active_player_data["error"],
-                        )
+                    return game_record, FetchResult(
+                        identifier=str(appid), success=False, error=str(e)
                     )
-            except Exception as e:
-                self.logger.log(
-                    f"Error fetching active player data for appid {appid}: {e}",
-                    level="error",
-                    verbose=True,
+
+                if not active_player_data["success"]:
+                    return game_record, FetchResult(
+                        identifier=str(appid),
+                        success=False,
+                        error=active_player_data["error"],
+                    )
+
+                src_data = active_player_data["data"]
+                monthly_data = {
+                    month["month"]: month["average_players"]
+                    for month in src_data.get("monthly_active_player", [])
+                }
+                game_record.update(monthly_data)
+                game_record.update(
+                    {
+                        "name": src_data.get("name"),
+                        "peak_active_player_all_time": src_data.get("peak_active_player_all_time"),
+                    }
+                )
+                all_months.update(monthly_data.keys())
+                return game_record, FetchResult(
+                    identifier=str(appid), success=True, data=game_record
                 )
-                all_results.append(FetchResult(identifier=str(appid), success=False, error=str(e)))
-            all_data.append(game_record)
 
-        normalized_data, sorted_months, fixed_columns, numeric_columns = (
-            normalize_active_player_rows(all_data, all_months, fill_na_as)
+        outcomes = await self._gather_in_order(
+            [fetch_one(idx, appid) for idx, appid in enumerate(steam_appids, start=1)]
         )
+        all_data = [game_record for game_record, _ in outcomes]
+        all_results = [fetch_result for _, fetch_result in outcomes]
 
         if return_as == "dataframe":
             pd = self._require_pandas()
-            df = pd.DataFrame(normalized_data, columns=fixed_columns + sorted_months)
-            df[numeric_columns] = df[numeric_columns].fillna(fill_na_as)
+            df = build_active_player_frame(pd, all_data, all_months, fill_na_as)
             return (df, all_results) if include_failures else df
 
+        normalized_data, _, _, _ = normalize_active_player_rows(all_data, all_months, fill_na_as)
         return (normalized_data, all_results) if include_failures else normalized_data
 
     async def get_game_review(
@@ -505,7 +463,10 @@ class AsyncCollector:
 
         for idx, steamid in enumerate(steamid_list, start=1):
             self.logger.log(
-                f"Fetching {idx} of {total}: user with steamid {steamid}",
+                "Fetching %d of %d: user with steamid %s",
+                idx,
+                total,
+                steamid,
                 level="info",
                 verbose=verbose,
             )
@@ -521,6 +482,21 @@ class AsyncCollector:
 
         return results
 
+    @staticmethod
+    async def _gather_in_order(coros: list[Coroutine[Any, Any, T]]) -> list[T]:
+        """Run coroutines concurrently, returning results in submission order.
+
+        If any coroutine raises, the remaining tasks are cancelled before the
+        exception propagates so no fetches keep running in the background.
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
     @staticmethod
     def _require_pandas() -> Any:
         try:
@@ -545,3 +521,14 @@ class AsyncCollector:
             await self._session.close()
             self._session = None
             self._initialized = False
+        self._flush_logs()
+
+    def _flush_logs(self) -> None:
+        """Flush buffered log records (see GAMEINSIGHTS_LOG_BUFFER) for the collector and sources."""
+        self.logger.flush()
+        for config in getattr(self, "_id_based_sources", []) + getattr(
+            self, "_name_based_sources", []
+        ):
+            config.source.logger.flush()
+        if hasattr(self, "steamuser"):
+            self.steamuser.logger.flush()
@@ -2,38 +2,39 @@ from __future__ import annotations
 
 import argparse
 import csv
-import io
 import json
+import math
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator
 
 if TYPE_CHECKING:
     import pandas as pd
 
 from gameinsights.collector import Collector, SourceConfig
+from gameinsights.model.game_data import pinned_today
+from gameinsights.utils.import_optional import import_orjson
+
+# Write buffer for CSV output files; large exports flush in 64 KiB chunks.
+_CSV_WRITE_BUFFER_SIZE = 1 << 16
 
 
 def _read_appids(appids: Iterable[str], appid_file: str | None) -> list[str]:
-    collected = [appid.strip() for appid in appids if appid.strip()]
+    collected = [appid.strip() for appid in appids]
 
     if appid_file:
         path = Path(appid_file)
         if not path.exists():
             raise FileNotFoundError(f"Appid file not found: {appid_file}")
         file_text = path.read_text(encoding="utf-8")
-        for raw in file_text.replace(",", "\n").splitlines():
-            normalized = raw.strip()
-            if normalized:
-                collected.append(normalized)
+        # str.split() with no separator splits on any whitespace run and never yields
+        # empty or untrimmed tokens, so commas only need mapping onto whitespace.
+        collected.extend(file_text.replace(",", " ").split())
 
-    unique_ids: list[str] = []
-    seen: set[str] = set()
-    for value in collected:
-        if value not in seen:
-            unique_ids.append(value)
-            seen.add(value)
-    return unique_ids
+    # dict.fromkeys dedups in first-occurrence order; "" is dropped afterwards.
+    unique = dict.fromkeys(collected)
+    unique.pop("", None)
+    return list(unique)
 
 
 def _build_source_index(configs: Iterable[SourceConfig]) -> dict[str, set[str]]:
@@ -49,10 +50,103 @@ def _filter_records(
 ) -> list[dict[str, Any]]:
     if not allowed_fields:
         return records
-    return [
-        {key: value for key, value in record.items() if key in allowed_fields}
-        for record in records
-    ]
+    return list(_iter_filtered_records(records, allowed_fields))
+
+
+def _iter_filtered_records(
+    records: Iterable[dict[str, Any]], allowed_fields: set[str]
+) -> Iterator[dict[str, Any]]:
+    for record in records:
+        # Records whose every key is allowed pass through without being copied.
+        if allowed_fields.issuperset(record):
+            yield record
+        else:
+            yield {key: value for key, value in record.items() if key in allowed_fields}
+
+
+def _replace_non_finite(value: Any) -> Any:
+    """Return ``value`` with NaN/inf floats replaced by None, recursing into containers."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+
+def _render_json_bytes(payload: list[dict[str, Any]]) -> bytes:
+    """Render records as indented UTF-8 JSON, using orjson when it is installed.
+
+    The stdlib fallback writes the same bytes as orjson: non-ASCII text is kept
+    as UTF-8 and non-finite floats become ``null``.
+    """
+    orjson = import_orjson()
+    if orjson is not None:
+        try:
+            rendered: bytes = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+            return rendered
+        except TypeError:
+            # Types orjson refuses (e.g. non-str keys) go through the stdlib encoder.
+            pass
+    try:
+        text = json.dumps(payload, indent=2, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        # Only payloads holding NaN/inf pay for the copy that maps them to null.
+        text = json.dumps(_replace_non_finite(payload), indent=2, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def _render_json(payload: list[dict[str, Any]]) -> str:
+    """Render records as indented JSON, using orjson when it is installed."""
+    return _render_json_bytes(payload).decode("utf-8")
+
+
+def _write_json_stdout(payload: list[dict[str, Any]]) -> None:
+    """Print records as JSON to stdout, as UTF-8 whatever the console encoding is.
+
+    Non-ASCII text is not escaped, so going through a text stream with a narrower
+    encoding (e.g. a cp1252 console) could raise UnicodeEncodeError.
+    """
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if stdout_buffer is None:
+        # Text-only streams (e.g. io.StringIO replacements) take str as-is.
+        print(_render_json(payload))
+        return
+    sys.stdout.flush()
+    stdout_buffer.write(_render_json_bytes(payload) + b"\n")
+    stdout_buffer.flush()
+
+
+def _write_csv(records: Iterable[dict[str, Any]], output_path: str | None) -> None:
+    """Write records as CSV to ``output_path``, or stdout when it is None.
+
+    Rows are pulled from ``records`` as they are written, so a lazy iterable keeps
+    memory flat. The header comes from the first record; nothing is written (and no
+    file is created) when there are no records.
+    """
+    rows = iter(records)
+    first = next(rows, None)
+    if first is None:
+        return
+    if output_path:
+        destination = Path(output_path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        with destination.open(
+            "w", newline="", encoding="utf-8", buffering=_CSV_WRITE_BUFFER_SIZE
+        ) as f:
+            _write_csv_rows(f, first, rows)
+    else:
+        _write_csv_rows(sys.stdout, first, rows)
+
+
+def _write_csv_rows(
+    stream: IO[str], first: dict[str, Any], rows: Iterator[dict[str, Any]]
+) -> None:
+    writer = csv.DictWriter(stream, fieldnames=first.keys())
+    writer.writeheader()
+    writer.writerow(first)
+    writer.writerows(rows)
 
 
 def _output_data(
@@ -82,13 +176,13 @@ def _output_data(
         else:
             json_payload = data if isinstance(data, list) else []
 
-        rendered = json.dumps(json_payload, indent=2)
         if output_path:
             destination = Path(output_path)
             destination.parent.mkdir(parents=True, exist_ok=True)
-            destination.write_text(rendered, encoding="utf-8")
+            # Write the encoded bytes as-is instead of decoding to str and re-encoding.
+            destination.write_bytes(_render_json_bytes(json_payload))
         else:
-            print(rendered)
+            _write_json_stdout(json_payload)
         return
 
     # CSV output with fallback
@@ -103,27 +197,7 @@ def _output_data(
             print(frame.to_csv(index=False), end="")
     else:
         # Use stdlib csv.DictWriter as fallback
-        if isinstance(data, list):
-            records = data
-        else:
-            records = []
-
-        if not records:
-            return
-        if output_path:
-            destination = Path(output_path)
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            with destination.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=records[0].keys())
-                writer.writeheader()
-                writer.writerows(records)
-        else:
-            buffer = io.StringIO()
-            writer = csv.DictWriter(buffer, fieldnames=records[0].keys())
-            writer.writeheader()
-            writer.writerows(records)
-            buffer.seek(0)
-            print(buffer.read(), end="")
+        _write_csv(data if isinstance(data, list) else [], output_path)
 
 
 def build_collect_parser() -> argparse.ArgumentParser:
@@ -236,12 +310,30 @@ def _run_collect(args: argparse.Namespace) -> int:
             _output_data(records, args.format, args.output)  # type: ignore[arg-type]
             return 0
 
-        records = collector.get_games_data(steam_appids, recap=args.recap, verbose=verbose)
+        allowed_fields: set[str] = set()
         if selected_sources:
-            allowed_fields: set[str] = {"steam_appid"}
+            allowed_fields.add("steam_appid")
             for entry in selected_sources:
                 allowed_fields.update(id_index.get(entry, set()))
                 allowed_fields.update(name_index.get(entry, set()))
+
+        if args.format == "csv":
+            # CSV rows are written as each game arrives instead of after the whole batch.
+            with pinned_today():
+                rows: Iterable[dict[str, Any]] = (
+                    result.data
+                    for result in collector.iter_games_data(
+                        steam_appids, recap=args.recap, verbose=verbose
+                    )
+                    if result.success and result.data is not None
+                )
+                if allowed_fields:
+                    rows = _iter_filtered_records(rows, allowed_fields)
+                _write_csv(rows, args.output)
+            return 0
+
+        records = collector.get_games_data(steam_appids, recap=args.recap, verbose=verbose)
+        if allowed_fields:
             records = _filter_records(records, allowed_fields)  # type: ignore[arg-type]
 
         _output_data(records, args.format, args.output)  # type: ignore[arg-type]
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
-import time
+import copy
+import threading
+import weakref
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
 from typing import TYPE_CHECKING, Any
 
 import requests
 from requests.adapters import HTTPAdapter
 
 from gameinsights._collector_utils import (
+    HOWLONGTOBEAT_FIELDS,
+    PROTONDB_FIELDS,
+    STEAMACHIEVEMENTS_FIELDS,
+    STEAMCHARTS_FIELDS,
+    STEAMREVIEW_FIELDS,
+    STEAMSPY_FIELDS,
+    STEAMSTORE_FIELDS,
     FetchResult,
     _SourceConfig,
+    build_active_player_frame,
     classify_source_error,
+    expand_duplicate_results,
     normalize_active_player_rows,
     post_process_raw_data,
     raise_for_fetch_failure,
@@ -22,7 +37,7 @@ from gameinsights.exceptions import (
     GameInsightsError,
     InvalidRequestError,
 )
-from gameinsights.model.game_data import GameDataModel
+from gameinsights.model.game_data import GameDataModel, pinned_today
 from gameinsights.sources import (
     HowLongToBeat,
     ProtonDB,
@@ -35,6 +50,8 @@ from gameinsights.sources import (
 )
 from gameinsights.sources.base import BaseSource, SourceResult
 from gameinsights.utils import LoggerWrapper, metrics
+from gameinsights.utils.cache import TTLCache
+from gameinsights.utils.http import POOL_MAXSIZE, create_http_adapter
 from gameinsights.utils.import_optional import import_pandas
 from gameinsights.utils.ratelimit import logged_rate_limited
 
@@ -43,19 +60,42 @@ if TYPE_CHECKING:
 
 SourceConfig = _SourceConfig[BaseSource]
 
+# One HTTPAdapter (and so one urllib3 PoolManager) per creating thread, shared by
+# every Collector built on that thread so short-lived collectors reuse connections.
+_thread_local = threading.local()
+# Every thread-shared adapter, so close() can leave them (and their pools) open.
+_shared_adapters: weakref.WeakSet[HTTPAdapter] = weakref.WeakSet()
+
+
+def _get_thread_adapter() -> HTTPAdapter:
+    adapter: HTTPAdapter | None = getattr(_thread_local, "adapter", None)
+    if adapter is None:
+        adapter = create_http_adapter()
+        _thread_local.adapter = adapter
+        _shared_adapters.add(adapter)
+    return adapter
+
 
 class Collector:
     """Collector for Steam game data from multiple sources.
 
     Thread Safety:
-        Each Collector instance owns a requests.Session that is NOT
-        thread-safe for concurrent use. Do NOT share a single Collector
-        instance across threads. Instead, create a separate Collector
-        per thread. Multiple Collectors are safe because each owns
-        an independent session.
+        Do NOT share a single Collector instance across threads; create a
+        separate Collector per thread. Calls on one Collector are not meant
+        to overlap.
+
+        Internally, the Collector does send requests from worker threads:
+        the ID-based sources of a game fan out over a small thread pool, and
+        with ``max_concurrency`` > 1 several games are fetched at once on a
+        second pool. This is safe because the shared requests.Session is only
+        read while fetching. Adapters are mounted once in ``__init__``, no
+        source changes session headers or settings, the cookie jar is locked
+        and urllib3's connection pools are thread-safe.
     """
 
     _session: requests.Session
+    _executor: ThreadPoolExecutor | None
+    _game_executor: ThreadPoolExecutor | None
     _closed: bool
 
     def __init__(
@@ -66,6 +106,9 @@ class Collector:
         boxleiter_multiplier: int = 30,
         calls: int = 60,
         period: int = 60,
+        cache_ttl: float | None = None,
+        cache_maxsize: int = 2048,
+        max_concurrency: int = 1,
     ) -> None:
         """Initialize the collector with an optional API key.
 
@@ -77,20 +120,38 @@ class Collector:
                 Default is 30 (typical modern median for post-2020 games).
             calls: Max number of API calls allowed per period. Default is 60.
             period: Time period in seconds for the rate limit. Default is 60.
+            cache_ttl: If set, successful source responses are reused for this many
+                seconds when the same appid/name is requested again. Default is None
+                (no caching).
+            cache_maxsize: Max number of cached source responses. Default is 2048.
+            max_concurrency: Max number of appids fetched at once by get_games_data,
+                iter_games_data and get_games_active_player_data. Results keep input
+                order and the rate limit still applies. Default is 1 (one game at a
+                time).
         """
+        if max_concurrency < 1:
+            raise InvalidRequestError("max_concurrency must be at least 1.")
         self._region = region
         self._language = language
         self._steam_api_key = steam_api_key
         self._boxleiter_multiplier = boxleiter_multiplier
         self.calls = calls
         self.period = period
+        self.max_concurrency = max_concurrency
         self._closed = False
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._game_executor = None
+        self._response_cache: TTLCache[SourceResult] | None = (
+            TTLCache(cache_maxsize, cache_ttl) if cache_ttl is not None else None
+        )
 
         self._session = self._create_session()
 
         try:
             self._init_sources()
             self._init_sources_config()
+            self._size_connection_pool()
         except Exception:
             self._session.close()
             raise
@@ -107,7 +168,9 @@ class Collector:
 
         Returns:
             A configured session with HTTPAdapter mounted for both
-            https:// and http:// schemes.
+            https:// and http:// schemes. The adapter is shared with other
+            sessions created on the same thread, and closing a Collector leaves
+            its pooled connections open for the next one.
 
         Note:
             This method is internal and creates sessions for hardcoded
@@ -115,15 +178,55 @@ class Collector:
             prevent SSRF (Server-Side Request Forgery) attacks.
         """
         session = requests.Session()
-        adapter = HTTPAdapter(
-            pool_connections=10,  # Sufficient for 9 sources across ~5 unique domains
-            pool_maxsize=20,  # Allows up to 20 concurrent connections per domain
-            pool_block=False,  # Don't block when pool is full
-        )
+        adapter = _get_thread_adapter()
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         return session
 
+    def _size_connection_pool(self) -> None:
+        """Mount a dedicated, larger adapter when fetches can outgrow the shared pool.
+
+        Every ID-based source of every game in flight may be fetching at once, and
+        sources share hosts (SteamStore and SteamReview both call
+        store.steampowered.com), so the worst case for one host is the source
+        executor's size. Above POOL_MAXSIZE the extra connections would otherwise
+        be discarded instead of kept alive.
+        """
+        max_connections = len(self._id_based_sources) * self.max_concurrency
+        if max_connections > POOL_MAXSIZE:
+            adapter = create_http_adapter(pool_maxsize=max_connections)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool used to fan out ID-based source fetches.
+
+        Created lazily on first use and sized to the number of ID-based
+        sources times ``max_concurrency``, so every source of every game in
+        flight can be fetched at once.
+        """
+        # Game workers (max_concurrency > 1) can get here at the same time.
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self.id_based_sources) * self.max_concurrency,
+                    thread_name_prefix=self.__class__.__name__,
+                )
+            return self._executor
+
+    def _get_game_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool that runs up to ``max_concurrency`` games at once.
+
+        Kept separate from the source pool: game workers block on source futures,
+        so sharing one pool could starve it.
+        """
+        if self._game_executor is None:
+            self._game_executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix=f"{self.__class__.__name__}-game",
+            )
+        return self._game_executor
+
     def _init_sources(self) -> None:
         """Initialize the sources with the current settings."""
         self.steamreview = SteamReview(session=self._session)
@@ -149,92 +252,16 @@ class Collector:
     def _init_sources_config(self) -> None:
         """Initialize sources config."""
         self._id_based_sources: list[SourceConfig] = [
-            SourceConfig(
-                self.steamstore,
-                [
-                    "steam_appid",
-                    "name",
-                    "developers",
-                    "publishers",
-                    "type",
-                    "price_currency",
-                    "price_initial",
-                    "price_final",
-                    "categories",
-                    "platforms",
-                    "genres",
-                    "metacritic_score",
-                    "release_date",
-                    "content_rating",
-                    "is_free",
-                    "is_coming_soon",
-                    "recommendations",
-                ],
-                is_primary=True,  # SteamStore is the primary source
-            ),
-            SourceConfig(
-                self.steamspy,
-                ["ccu", "tags", "discount", "average_playtime_min", "languages"],
-            ),
-            SourceConfig(
-                self.steamcharts,
-                ["active_player_24h", "peak_active_player_all_time", "monthly_active_player"],
-            ),
-            SourceConfig(
-                self.steamreview,
-                [
-                    "review_score",
-                    "review_score_desc",
-                    "total_positive",
-                    "total_negative",
-                    "total_reviews",
-                ],
-            ),
-            SourceConfig(
-                self.steamachievements,
-                [
-                    "achievements_count",
-                    "achievements_percentage_average",
-                    "achievements_list",
-                ],
-            ),
-            SourceConfig(
-                self.protondb,
-                [
-                    "protondb_tier",
-                    "protondb_score",
-                    "protondb_trending",
-                    "protondb_confidence",
-                    "protondb_total",
-                ],
-            ),
+            SourceConfig(self.steamstore, STEAMSTORE_FIELDS, is_primary=True),
+            SourceConfig(self.steamspy, STEAMSPY_FIELDS),
+            SourceConfig(self.steamcharts, STEAMCHARTS_FIELDS),
+            SourceConfig(self.steamreview, STEAMREVIEW_FIELDS),
+            SourceConfig(self.steamachievements, STEAMACHIEVEMENTS_FIELDS),
+            SourceConfig(self.protondb, PROTONDB_FIELDS),
         ]
 
         self._name_based_sources: list[SourceConfig] = [
-            SourceConfig(
-                self.howlongtobeat,
-                [
-                    "comp_main",
-                    "comp_plus",
-                    "comp_100",
-                    "comp_all",
-                    "comp_main_count",
-                    "comp_plus_count",
-                    "comp_100_count",
-                    "comp_all_count",
-                    "invested_co",
-                    "invested_mp",
-                    "invested_co_count",
-                    "invested_mp_count",
-                    "count_comp",
-                    "count_speed_run",
-                    "count_backlog",
-                    "count_review",
-                    "review_score",
-                    "count_playing",
-                    "count_retired",
-                ],
-            ),
+            SourceConfig(self.howlongtobeat, HOWLONGTOBEAT_FIELDS),
         ]
 
     @property
@@ -288,6 +315,7 @@ class Collector:
         if self._region != value:
             self._region = value
             self.steamstore.region = value
+            self._clear_response_cache()
 
     @property
     def language(self) -> str:
@@ -298,6 +326,7 @@ class Collector:
         if self._language != value:
             self._language = value
             self.steamstore.language = value
+            self._clear_response_cache()
 
     @property
     def steam_api_key(self) -> str | None:
@@ -310,6 +339,12 @@ class Collector:
             self.steamstore.api_key = value
             self.steamachievements.api_key = value
             self.steamuser.api_key = value
+            self._clear_response_cache()
+
+    def _clear_response_cache(self) -> None:
+        """Drop cached responses; they were fetched with the previous region/language/key."""
+        if self._response_cache is not None:
+            self._response_cache.clear()
 
     def get_user_data(
         self,
@@ -332,21 +367,22 @@ class Collector:
         Raises:
             DependencyNotInstalledError: If return_as="dataframe" and pandas is not installed. Install with: pip install gameinsights[dataframe]
         """
-        steamid_list = (
-            [steamids] if isinstance(steamids, str) or isinstance(steamids, int) else steamids
-        )
+        steamid_list = [steamids] if isinstance(steamids, (str, int)) else steamids
 
         results = []
         total = len(steamid_list)
 
         for idx, steamid in enumerate(steamid_list, start=1):
             self.logger.log(
-                f"Fetching {idx} of {total}: user with steamid {steamid}",
+                "Fetching %d of %d: user with steamid %s",
+                idx,
+                total,
+                steamid,
                 level="info",
                 verbose=verbose,
             )
 
-            fetch_result = self.steamuser.fetch(
+            fetch_result = self._fetch_user_data(
                 steamid=steamid, include_free_games=include_free_games, verbose=verbose
             )
             if fetch_result["success"]:
@@ -356,8 +392,6 @@ class Collector:
                 user_data = {"steamid": steamid}
                 results.append(user_data)
 
-            time.sleep(0.25)  # internal sleep to prevent over-calling
-
         if return_as == "dataframe":
             pd = self._require_pandas()
             return pd.DataFrame(results)  # type: ignore[no-any-return]
@@ -371,6 +405,8 @@ class Collector:
         verbose: bool = True,
         include_failures: bool = False,
         raise_on_error: bool = False,
+        *,
+        deduplicate: bool = False,
     ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], list[FetchResult]]:
         """Fetch game recap data.
 
@@ -386,6 +422,9 @@ class Collector:
             include_failures: If True, returns tuple of (successful_data, all_results_with_status).
             raise_on_error: If True, raise exceptions when primary source fails.
                 When False (default), errors are silently absorbed into FetchResult.
+            deduplicate: If True, each distinct appid is fetched once and its result is
+                copied to every position it appears at. Default is False (every entry
+                is fetched independently).
 
         Returns:
             List of games recap data (when include_failures=False and raise_on_error=False).
@@ -407,43 +446,131 @@ class Collector:
               the function does not return a (data, results) tuple even if include_failures=True.
               The raise_on_error parameter takes precedence over include_failures.
         """
+        to_fetch = steam_appids
+        with_duplicates: list[str] | None = None
+        if deduplicate and isinstance(steam_appids, (list, tuple)):
+            to_fetch = list(dict.fromkeys(steam_appids))
+            if len(to_fetch) != len(steam_appids):
+                with_duplicates = list(steam_appids)
+
+        with pinned_today():
+            all_results = list(
+                self.iter_games_data(
+                    to_fetch, recap=recap, verbose=verbose, raise_on_error=raise_on_error
+                )
+            )
+
+        if with_duplicates is not None:
+            all_results = expand_duplicate_results(with_duplicates, all_results)
+        result = [r.data for r in all_results if r.success and r.data is not None]
+
+        if include_failures:
+            return result, all_results
+        return result
+
+    def iter_games_data(
+        self,
+        steam_appids: str | list[str],
+        recap: bool = False,
+        verbose: bool = True,
+        raise_on_error: bool = False,
+    ) -> Iterator[FetchResult]:
+        """Fetch game data lazily, yielding one FetchResult per appid.
+
+        Streaming counterpart of get_games_data for large batches: each game's
+        payload is available (in FetchResult.data) as soon as it is fetched, so
+        callers can write results out without holding the whole batch in memory.
+
+        Args:
+            steam_appids: steam_appid of the game(s) to fetch data for.
+            recap: If True, yields the recap data instead of the full model dump.
+            verbose: If True, will log the fetching process.
+            raise_on_error: If True, raise exceptions when primary source fails.
+
+        Yields:
+            FetchResult for each appid, in input order.
+
+        Raises:
+            GameNotFoundError: If raise_on_error=True and SteamStore reports game doesn't exist
+            SourceUnavailableError: If raise_on_error=True and SteamStore is unreachable
+            InvalidRequestError: If raise_on_error=True and steam_appids is empty
+        """
         if raise_on_error and not steam_appids:
             raise InvalidRequestError("steam_appids must be a non-empty string or list.")
 
         if isinstance(steam_appids, (str, int)):
             steam_appids = [steam_appids]
 
-        result = []
-        all_results: list[FetchResult] = []
         total = len(steam_appids)
-        for idx, appid in enumerate(steam_appids, start=1):
-            self.logger.log(
-                f"Fetching {idx} of {total} game data: steam appid {appid}..",
-                level="info",
+        if self.max_concurrency == 1:
+            for idx, appid in enumerate(steam_appids, start=1):
+                yield self._fetch_game_result(idx, total, appid, recap, verbose, raise_on_error)
+            return
+
+        # Keep at most max_concurrency games in flight and yield them in input order, so
+        # results still stream and a raise_on_error failure stops further submissions.
+        # Each task runs in a copy of the caller's context to keep pinned_today() in effect.
+        executor = self._get_game_executor()
+        pending: deque[Future[FetchResult]] = deque()
+        try:
+            for idx, appid in enumerate(steam_appids, start=1):
+                pending.append(
+                    executor.submit(
+                        copy_context().run,
+                        self._fetch_game_result,
+                        idx,
+                        total,
+                        appid,
+                        recap,
+                        verbose,
+                        raise_on_error,
+                    )
+                )
+                if len(pending) >= self.max_concurrency:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _fetch_game_result(
+        self,
+        idx: int,
+        total: int,
+        appid: str,
+        recap: bool,
+        verbose: bool,
+        raise_on_error: bool,
+    ) -> FetchResult:
+        """Fetch one game for iter_games_data and wrap the outcome in a FetchResult."""
+        self.logger.log(
+            "Fetching %d of %d game data: steam appid %s..",
+            idx,
+            total,
+            appid,
+            level="info",
+            verbose=verbose,
+        )
+        try:
+            game_data = self._fetch_raw_data(
+                appid,
                 verbose=verbose,
+                raise_on_primary_failure=raise_on_error,
             )
-            try:
-                game_data = self._fetch_raw_data(
-                    appid,
-                    verbose=verbose,
-                    raise_on_primary_failure=raise_on_error,
-                )
-                payload = game_data.get_recap() if recap else game_data.model_dump(mode="json")
-                result.append(payload)
-                all_results.append(FetchResult(identifier=str(appid), success=True, data=payload))
-            except GameInsightsError as e:
-                if raise_on_error:
-                    raise
-                self.logger.log(
-                    f"Error fetching data for game {appid}: {e}",
-                    level="error",
-                    verbose=True,
-                )
-                all_results.append(FetchResult(identifier=str(appid), success=False, error=str(e)))
-
-        if include_failures:
-            return result, all_results
-        return result
+            payload = game_data.get_recap() if recap else game_data.model_dump(mode="json")
+            return FetchResult(identifier=str(appid), success=True, data=payload)
+        except GameInsightsError as e:
+            if raise_on_error:
+                raise
+            self.logger.log(
+                "Error fetching data for game %s: %s",
+                appid,
+                e,
+                level="error",
+                verbose=True,
+            )
+            return FetchResult(identifier=str(appid), success=False, error=str(e))
 
     def get_games_active_player_data(
         self,
@@ -492,79 +619,104 @@ class Collector:
         if isinstance(steam_appids, (str, int)):
             steam_appids = [steam_appids]
 
+        total = len(steam_appids)
+        if self.max_concurrency == 1:
+            rows = [
+                self._fetch_active_player_record(idx, total, appid, verbose)
+                for idx, appid in enumerate(steam_appids, start=1)
+            ]
+        else:
+            executor = self._get_game_executor()
+            futures = [
+                executor.submit(self._fetch_active_player_record, idx, total, appid, verbose)
+                for idx, appid in enumerate(steam_appids, start=1)
+            ]
+            rows = [future.result() for future in futures]
+
         all_months: set[str] = set()
         all_data = []
-        total = len(steam_appids)
         all_results: list[FetchResult] = []
-
-        for idx, appid in enumerate(steam_appids, start=1):
-            self.logger.log(
-                f"Fetching {idx} of {total}: active player data for appid {appid}..",
-                level="info",
-                verbose=verbose,
-            )
-            game_record = {
-                "steam_appid": appid,
-            }
-
-            try:
-                active_player_data = self.steamcharts.fetch(
-                    appid,
-                    verbose=verbose,
-                    selected_labels=[
-                        "name",
-                        "peak_active_player_all_time",
-                        "monthly_active_player",
-                    ],
-                )
-
-                if active_player_data.get("success"):
-                    monthly_data = {
-                        month["month"]: month["average_players"]
-                        for month in active_player_data["data"].get("monthly_active_player", [])
-                    }
-                    game_record.update(monthly_data)
-                    game_record.update(
-                        {
-                            "name": active_player_data["data"].get("name"),
-                            "peak_active_player_all_time": (
-                                active_player_data["data"].get("peak_active_player_all_time")
-                            ),
-                        }
-                    )
-                    all_months.update(monthly_data.keys())
-                    all_results.append(
-                        FetchResult(identifier=str(appid), success=True, data=game_record.copy())
-                    )
-                else:
-                    all_results.append(
-                        FetchResult(
-                            identifier=str(appid),
-                            success=False,
-                            error=active_player_data.get("error", "Unknown error"),
-                        )
-                    )
-            except Exception as e:
-                self.logger.log(
-                    f"Error fetching active player data for appid {appid}: {e}",
-                    level="error",
-                    verbose=True,
-                )
-                all_results.append(FetchResult(identifier=str(appid), success=False, error=str(e)))
+        for game_record, fetch_result, months in rows:
             all_data.append(game_record)
-
-        normalized_data, sorted_months, fixed_columns, numeric_columns = (
-            normalize_active_player_rows(all_data, all_months, fill_na_as)
-        )
+            all_results.append(fetch_result)
+            all_months.update(months)
 
         if return_as == "dataframe":
             pd = self._require_pandas()
-            df = pd.DataFrame(normalized_data, columns=fixed_columns + sorted_months)
-            df[numeric_columns] = df[numeric_columns].fillna(fill_na_as)
+            df = build_active_player_frame(pd, all_data, all_months, fill_na_as)
             return (df, all_results) if include_failures else df
 
+        normalized_data, _, _, _ = normalize_active_player_rows(all_data, all_months, fill_na_as)
         return (normalized_data, all_results) if include_failures else normalized_data
 
+    def _fetch_active_player_record(
+        self, idx: int, total: int, appid: str, verbose: bool
+    ) -> tuple[dict[str, Any], FetchResult, list[str]]:
+        """Fetch one appid for get_games_active_player_data.
+
+        Returns the game record, its FetchResult and the months it has data for.
+        """
+        self.logger.log(
+            "Fetching %d of %d: active player data for appid %s..",
+            idx,
+            total,
+            appid,
+            level="info",
+            verbose=verbose,
+        )
+        game_record: dict[str, Any] = {
+            "steam_appid": appid,
+        }
+
+        try:
+            active_player_data = self.steamcharts.fetch(
+                appid,
+                verbose=verbose,
+                selected_labels=[
+                    "name",
+                    "peak_active_player_all_time",
+                    "monthly_active_player",
+                ],
+            )
+
+            if active_player_data.get("success"):
+                monthly_data = {
+                    month["month"]: month["average_players"]
+                    for month in active_player_data["data"].get("monthly_active_player", [])
+                }
+                game_record.update(monthly_data)
+                game_record.update(
+                    {
+                        "name": active_player_data["data"].get("name"),
+                        "peak_active_player_all_time": (
+                            active_player_data["data"].get("peak_active_player_all_time")
+                        ),
+                    }
+                )
+                return (
+                    game_record,
+                    FetchResult(identifier=str(appid), success=True, data=game_record),
+                    list(monthly_data),
+                )
+            return (
+                game_record,
+                FetchResult(
+                    identifier=str(appid),
+                    success=False,
+                    error=active_player_data.get("error", "Unknown error"),
+                ),
+                [],
+            )
+        except Exception as e:
+            self.logger.log(
+                "Error fetching active player data for appid %s: %s",
+                appid,
+                e,
+                level="error",
+                verbose=True,
+            )
+            return game_record, FetchResult(identifier=str(appid), success=False, error=str(e)), []
+
     def get_game_review(
         self,
         steam_appid: str,
@@ -595,7 +747,8 @@ class Collector:
             raise InvalidRequestError("steam_appid must be a non-empty string.")
 
         self.logger.log(
-            f"Fetching reviews for appid {steam_appid}..",
+            "Fetching reviews for appid %s..",
+            steam_appid,
             level="info",
             verbose=verbose,
         )
@@ -620,6 +773,20 @@ class Collector:
 
         return records
 
+    @logged_rate_limited()
+    def _fetch_user_data(
+        self, steamid: str, include_free_games: bool, verbose: bool
+    ) -> SourceResult:
+        """Fetch a single user's data, throttled by the collector's rate limit.
+
+        Only blocks once ``calls`` requests have been made within ``period``
+        seconds, instead of pausing unconditionally between users.
+        """
+        result: SourceResult = self.steamuser.fetch(
+            steamid=steamid, include_free_games=include_free_games, verbose=verbose
+        )
+        return result
+
     @logged_rate_limited()
     def _fetch_raw_data(
         self,
@@ -647,13 +814,22 @@ class Collector:
         identifier = str(steam_appid)
         raw_data: dict[str, Any] = {"steam_appid": identifier}
 
-        for config in self.id_based_sources:
-            source_data = self._fetch_with_observability(
+        # ID-based sources are independent of each other, so fetch them concurrently
+        # and merge the results in config order once they have all resolved.
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                self._fetch_with_observability,
                 config.source,
                 identifier=identifier,
                 scope="id",
                 verbose=verbose,
             )
+            for config in self.id_based_sources
+        ]
+
+        for config, future in zip(self.id_based_sources, futures):
+            source_data = future.result()
             if source_data["success"]:
                 raw_data.update({key: source_data["data"][key] for key in config.fields})
             elif raise_on_primary_failure and config.is_primary:
@@ -689,6 +865,16 @@ class Collector:
         verbose: bool,
     ) -> SourceResult:
         source_name = source.__class__.__name__
+        cache = self._response_cache
+        cache_key = (source_name, scope, identifier)
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                if metrics.enabled:
+                    metrics.counter("source_cache_hits_total", source=source_name, scope=scope)
+                # Hand out a copy so callers mutating lists or rows can't corrupt the entry.
+                return copy.deepcopy(cached)
+
         source.logger.log_event(
             "source_fetch_start",
             verbose=verbose,
@@ -717,6 +903,9 @@ class Collector:
             result["success"],
         )
 
+        # Only successes are reused; failures are retried on the next request.
+        if cache is not None and result["success"]:
+            cache.set(cache_key, copy.deepcopy(result))
         return result
 
     def __enter__(self) -> "Collector":
@@ -729,13 +918,18 @@ class Collector:
             # Log but don't suppress the original exception from with block
             if hasattr(self, "_logger"):
                 self.logger.log(
-                    f"Error closing session: {e}",
+                    "Error closing session: %s",
+                    e,
                     level="error",
                     verbose=True,
                 )
 
     def close(self) -> None:
-        """Close the HTTP session and release all pooled connections.
+        """Close the HTTP session and release the connections this Collector owns.
+
+        Connections pooled by the adapter shared with other Collectors on the
+        creating thread stay open for reuse; a dedicated adapter sized for
+        ``max_concurrency`` is closed with the session.
 
         This method should be called when done making requests to properly
         close HTTP connections and release resources. When using the Collector
@@ -745,5 +939,24 @@ class Collector:
         beyond the first call.
         """
         if not self._closed:
+            if self._game_executor is not None:
+                self._game_executor.shutdown(wait=True, cancel_futures=True)
+                self._game_executor = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+            # Session.close() closes every mounted adapter; unmount the thread-shared one
+            # first so other and later Collectors on that thread keep its pooled connections.
+            adapters = self._session.adapters
+            for prefix in [p for p, a in adapters.items() if a in _shared_adapters]:
+                del adapters[prefix]
             self._session.close()
+            self._flush_logs()
             self._closed = True
+
+    def _flush_logs(self) -> None:
+        """Flush buffered log records (see GAMEINSIGHTS_LOG_BUFFER) for the collector and sources."""
+        self.logger.flush()
+        for config in self.id_based_sources + self.name_based_sources:
+            config.source.logger.flush()
+        self.steamuser.logger.flush()
@@ -1,5 +1,10 @@
 import math
-from datetime import datetime
+import re
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
 from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -7,12 +12,185 @@ from typing_extensions import Self
 
 from gameinsights.model.types import AchievementEntry, ContentRating, MonthlyActivePlayer
 
+# Field kinds coerced by GameDataModel.normalize_fields.
+_INT_FIELDS = frozenset(
+    {
+        "metacritic_score",
+        "copies_sold",
+        "estimated_revenue",
+        "owners",
+        "followers",
+        "ccu",
+        "active_player_24h",
+        "peak_active_player_all_time",
+        "review_score",
+        "total_positive",
+        "total_negative",
+        "total_reviews",
+        "achievements_count",
+        "comp_main",
+        "comp_plus",
+        "comp_100",
+        "comp_all",
+        "comp_main_count",
+        "comp_plus_count",
+        "comp_100_count",
+        "comp_all_count",
+        "invested_co",
+        "invested_mp",
+        "invested_co_count",
+        "invested_mp_count",
+        "count_comp",
+        "count_speed_run",
+        "count_backlog",
+        "count_review",
+        "count_playing",
+        "count_retired",
+        "recommendations",
+        "protondb_total",
+    }
+)
+_FLOAT_FIELDS = frozenset(
+    {
+        "price_initial",
+        "price_final",
+        "average_playtime_h",
+        "average_playtime_min",
+        "achievements_percentage_average",
+        "discount",
+        "protondb_score",
+    }
+)
+_OPTIONAL_STR_FIELDS = frozenset(
+    {"name", "type", "protondb_tier", "protondb_trending", "protondb_confidence"}
+)
+_LIST_FIELDS = frozenset(
+    {
+        "developers",
+        "publishers",
+        "platforms",
+        "categories",
+        "genres",
+        "tags",
+        "languages",
+        "content_rating",
+        "monthly_active_player",
+        "achievements_list",
+    }
+)
+# Low-cardinality string fields; interning lets every model in a batch share one str
+# object per distinct value instead of holding a fresh copy from each JSON payload.
+_INTERN_FIELDS = frozenset(
+    {
+        "type",
+        "price_currency",
+        "protondb_tier",
+        "protondb_trending",
+        "protondb_confidence",
+        "platforms",
+        "categories",
+        "genres",
+        "tags",
+        "languages",
+    }
+)
+
+# Today's date ordinal, pinned for the duration of a batch by pinned_today() so
+# days_since_release is computed against one clock read instead of one per model.
+_TODAY_ORDINAL: ContextVar[int | None] = ContextVar("_TODAY_ORDINAL", default=None)
+
+
+@contextmanager
+def pinned_today() -> Iterator[None]:
+    """Use a single "today" for every GameDataModel built inside the block."""
+    token = _TODAY_ORDINAL.set(date.today().toordinal())
+    try:
+        yield
+    finally:
+        _TODAY_ORDINAL.reset(token)
+
+
+# The two release-date layouts the sources emit, '%Y-%m-%d' and '%b %d, %Y'. The patterns
+# accept what strptime accepts for those formats (1-2 digit month/day, any month casing,
+# runs of whitespace), so unmatched strings are rejected without raising.
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_STEAM_DATE_RE = re.compile(r"([A-Za-z]{3})\s+(\d{1,2}),\s+(\d{4})")
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+def _parse_date_string(v: str) -> datetime | None:
+    """Parse '%Y-%m-%d' or '%b %d, %Y'; None when neither layout matches.
+
+    Out-of-range parts (e.g. 'Feb 30, 2023') still raise ValueError from datetime().
+    """
+    match = _ISO_DATE_RE.fullmatch(v)
+    if match:
+        year, month, day = match.groups()
+        return datetime(int(year), int(month), int(day))
+    match = _STEAM_DATE_RE.fullmatch(v)
+    if match:
+        mon, day, year = match.groups()
+        month_number = _MONTHS.get(mon.title())
+        if month_number is not None:
+            return datetime(int(year), month_number, int(day))
+    return None
+
+
+def _to_int(v: Any) -> int | None:
+    """Coerce numeric-like values to int; None and unparseable values become None."""
+    if v is None or type(v) is int:
+        return v
+    try:
+        return int(v)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _to_float(v: Any) -> float | None:
+    """Convert to float or None; rejects NaN/inf as absent data."""
+    if v is None:
+        return None
+    try:
+        result = float(v)
+    except (ValueError, TypeError):
+        return None
+    return result if math.isfinite(result) else None
+
+
+def _intern(v: Any) -> Any:
+    """Intern a string, or each string in a list; other values pass through."""
+    if type(v) is str:
+        return sys.intern(v)
+    if isinstance(v, list):
+        return [sys.intern(s) if type(s) is str else s for s in v]
+    return v
+
+
+def _to_list(v: Any) -> list[Any]:
+    """Ensure the value is a list (convert single values/None to lists)."""
+    if v is None:
+        return []
+    return v if isinstance(v, list) else [v]
+
 
 class GameDataModel(BaseModel):
     """Complete game data model with Python 3.10+ type hints and Pydantic v2 validation.
 
     Note on steam_appid coercion:
-        The ensure_string validator (field_validator for steam_appid, mode="before")
+        The normalize_fields validator (model_validator, mode="before")
         coerces None values to an empty string (""). This means GameDataModel can be
         instantiated with steam_appid=None or steam_appid="" and both will result in
         steam_appid=="". An empty value indicates missing/invalid data, and callers
@@ -102,122 +280,40 @@ class GameDataModel(BaseModel):
             return v
         try:
             if isinstance(v, str):
-                # Try ISO 8601 format first (YYYY-MM-DD)
-                try:
-                    return datetime.strptime(v, "%Y-%m-%d")
-                except ValueError:
-                    pass
-                # Try Steam format (MMM DD, YYYY)
-                return datetime.strptime(v, "%b %d, %Y")
+                return _parse_date_string(v)
             elif isinstance(v, (int, float)):
                 return datetime.fromtimestamp(v)
         except (ValueError, TypeError):
             return None
 
-    @field_validator(
-        "metacritic_score",
-        "copies_sold",
-        "estimated_revenue",
-        "owners",
-        "followers",
-        "ccu",
-        "active_player_24h",
-        "peak_active_player_all_time",
-        "review_score",
-        "total_positive",
-        "total_negative",
-        "total_reviews",
-        "achievements_count",
-        "comp_main",
-        "comp_plus",
-        "comp_100",
-        "comp_all",
-        "comp_main_count",
-        "comp_plus_count",
-        "comp_100_count",
-        "comp_all_count",
-        "invested_co",
-        "invested_mp",
-        "invested_co_count",
-        "invested_mp_count",
-        "count_comp",
-        "count_speed_run",
-        "count_backlog",
-        "count_review",
-        "count_playing",
-        "count_retired",
-        "recommendations",
-        "protondb_total",
-        mode="before",
-    )
-    def handle_integers(cls, v: str | int | float | None) -> int | None:
-        """Coerce numeric-like values to int; None and unparseable values become None."""
-        if v is None:
-            return None
-        try:
-            return int(v)
-        except (ValueError, TypeError):
-            return None
-
-    @field_validator(
-        "price_initial",
-        "price_final",
-        "average_playtime_h",
-        "average_playtime_min",
-        "achievements_percentage_average",
-        "discount",
-        "protondb_score",
-        mode="before",
-    )
-    def handle_float(cls, v: str | int | float | None) -> float | None:
-        """Convert to float or None; rejects NaN/inf as absent data."""
-        if v is None:
-            return None
-        try:
-            result = float(v)
-            if not math.isfinite(result):
-                return None
-            return result
-        except (ValueError, TypeError):
-            return None
-
-    @field_validator("steam_appid", mode="before")
-    def ensure_string(cls, v: str | None) -> str:
-        """Coerce to string; None becomes empty string for required fields."""
-        return "" if v is None else str(v)
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_fields(cls, data: Any) -> Any:
+        """Coerce raw source values in a single pass over the input dict.
 
-    @field_validator(
-        "name",
-        "type",
-        "protondb_tier",
-        "protondb_trending",
-        "protondb_confidence",
-        mode="before",
-    )
-    def ensure_optional_string(cls, v: str | int | None) -> str | None:
-        """Coerce to string or preserve None for nullable fields."""
-        if v is None:
-            return None
-        return str(v)
+        Replaces one field_validator callback per field with a lookup in the
+        module-level field-kind sets; only keys present in the input are touched.
+        """
+        if not isinstance(data, dict):
+            return data
 
-    @field_validator(
-        "developers",
-        "publishers",
-        "platforms",
-        "categories",
-        "genres",
-        "tags",
-        "languages",
-        "content_rating",
-        "monthly_active_player",
-        "achievements_list",
-        mode="before",
-    )
-    def ensure_list(cls, v: list[Any] | str | int | None) -> list[Any]:
-        """ensure the fields are always lists (convert single values/none to lists)"""
-        if v is None:
-            return []
-        return v if isinstance(v, list) else [v]
+        normalized: dict[str, Any] = {}
+        for key, value in data.items():
+            if key in _INT_FIELDS:
+                value = _to_int(value)
+            elif key in _FLOAT_FIELDS:
+                value = _to_float(value)
+            elif key in _LIST_FIELDS:
+                value = _to_list(value)
+            elif key in _OPTIONAL_STR_FIELDS:
+                value = None if value is None else str(value)
+            elif key == "steam_appid":
+                # None becomes an empty string for the required field.
+                value = "" if value is None else str(value)
+            if key in _INTERN_FIELDS:
+                value = _intern(value)
+            normalized[key] = value
+        return normalized
 
     def get_recap(self) -> dict[str, Any]:
         """Create a reduced model with only recap fields.
@@ -225,7 +321,21 @@ class GameDataModel(BaseModel):
         Returns a JSON-safe dict: datetime fields are ISO strings, all values
         are JSON-serializable (no NaN, no raw datetime objects).
         """
-        return self.model_dump(mode="json", include=self._RECAP_FIELDS)
+        release_date = self.release_date
+        if release_date is not None and release_date.tzinfo is not None:
+            # Aware datetimes keep pydantic's JSON spelling (e.g. "Z" for UTC).
+            return self.model_dump(mode="json", include=self._RECAP_FIELDS)
+
+        # Read attributes directly in field order instead of going through the pydantic
+        # serializer; list values are copied so the recap never aliases model state.
+        values = self.__dict__
+        recap: dict[str, Any] = {}
+        for key in _RECAP_KEYS:
+            value = values[key]
+            recap[key] = value.copy() if type(value) is list else value
+        if release_date is not None:
+            recap["release_date"] = release_date.isoformat()
+        return recap
 
     @model_validator(mode="after")
     def preprocess_data(self) -> Self:
@@ -241,7 +351,8 @@ class GameDataModel(BaseModel):
 
     def compute_days_since_release(self) -> None:
         if self.release_date:
-            self.days_since_release = (datetime.now() - self.release_date).days
+            today = _TODAY_ORDINAL.get() or date.today().toordinal()
+            self.days_since_release = today - self.release_date.toordinal()
 
     _RECAP_FIELDS: ClassVar[set[str]] = {
         "steam_appid",
@@ -283,3 +394,9 @@ class GameDataModel(BaseModel):
         # Review scores
         "metacritic_score",
     }
+
+
+# Recap fields in model declaration order, matching model_dump(include=...) key order.
+_RECAP_KEYS = tuple(
+    name for name in GameDataModel.model_fields if name in GameDataModel._RECAP_FIELDS
+)
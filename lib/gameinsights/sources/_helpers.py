@@ -6,11 +6,52 @@ duplication between sync and async source implementations.
 
 from __future__ import annotations
 
+import json
+import re
 from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import urljoin
+
+from gameinsights.utils.import_optional import import_orjson
 
 if TYPE_CHECKING:
     from gameinsights.sources.base import ErrorResult
 
+_orjson = import_orjson()
+
+
+def loads_json(text: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Inputs orjson rejects but the stdlib accepts (NaN/Infinity literals, lone
+    surrogates) are re-parsed with ``json.loads``, so invalid input still raises
+    ``json.JSONDecodeError``. orjson reads integers wider than 64 bits as floats.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(text)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+# Charsets orjson can read directly; anything else goes through the response's own decoder.
+_UTF8_CHARSETS = frozenset({"utf-8", "utf8"})
+
+
+def response_json(response: Any) -> Any:
+    """Decode a response body as JSON, parsing the raw bytes with ``loads_json``.
+
+    This skips the ``.text`` decode that ``requests.Response.json()`` does first.
+    Responses without a bytes ``.content``, or with a non-UTF-8 charset, use
+    ``response.json()`` as before.
+    """
+    content = getattr(response, "content", None)
+    if isinstance(content, bytes):
+        encoding = getattr(response, "encoding", None)
+        if encoding is None or encoding.lower() in _UTF8_CHARSETS:
+            return loads_json(content)
+    return response.json()
+
 
 def build_error_result(
     error_message: str,
@@ -35,6 +76,26 @@ def prepare_identifier(
     return identifier_str
 
 
+# Relative endpoints made of plain segments (e.g. "570" or "api/v1/570.json"): no leading
+# slash, scheme, query, fragment or dot segments, so urljoin would only append them.
+_SIMPLE_ENDPOINT_RE = re.compile(r"[\w\-]+(?:[./][\w\-]+)*")
+
+
+def build_request_url(base_url: str, endpoint: str | None = None) -> str:
+    """Join a source base URL and an optional endpoint the way ``urljoin`` does.
+
+    Plain relative endpoints, which is what the sources pass, are appended directly;
+    anything else goes through ``urljoin`` for its full resolution rules.
+    """
+    final_url = base_url.rstrip("/")
+    if not endpoint:
+        return final_url
+    endpoint = endpoint.rstrip("/")
+    if _SIMPLE_ENDPOINT_RE.fullmatch(endpoint):
+        return f"{final_url}/{endpoint}"
+    return urljoin(final_url + "/", endpoint)
+
+
 def fetch_and_parse_json(
     response: Any,
     extra_json_exceptions: tuple[type[Exception], ...] = (),
@@ -42,7 +103,7 @@ def fetch_and_parse_json(
     if response.status_code != 200:
         return None
     try:
-        data = response.json()
+        data = response_json(response)
         if isinstance(data, dict):
             return data
         return None
@@ -63,11 +124,10 @@ def filter_valid_labels(
         validation_set: frozenset[str] = frozenset(valid_labels)
     else:
         validation_set = class_valid_labels_set  # type: ignore[assignment]
-    valid: list[str] = []
-    invalid: list[str] = []
-    for label in selected_labels:
-        (valid if label in validation_set else invalid).append(label)
-    if invalid and log_fn is not None:
+    valid = [label for label in selected_labels if label in validation_set]
+    # Invalid labels are only collected when some were dropped (the rare path).
+    if len(valid) != len(selected_labels) and log_fn is not None:
+        invalid = [label for label in selected_labels if label not in validation_set]
         reference_labels = valid_labels if valid_labels is not None else class_valid_labels
         log_fn(
             f"Ignoring the following invalid labels: {invalid}, "
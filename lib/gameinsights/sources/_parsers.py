@@ -11,11 +11,14 @@ same functions instead of duplicating the logic.
 
 from __future__ import annotations
 
+import json
+import re
 from datetime import datetime
 from typing import Any, Callable, Literal
 
 from bs4.element import Tag
 
+from gameinsights.sources._helpers import loads_json
 from gameinsights.sources._schemas import _HOWLONGTOBEAT_LABELS
 
 # ---------------------------------------------------------------------------
@@ -520,6 +523,11 @@ def generate_search_payload(game_name: str) -> dict[str, Any]:
     }
 
 
+# Game pages embed their data as a single JSON script tag. Compiled once; the
+# [^>]* attribute run cannot wander past the opening tag like a lazy .*? can.
+_HLTB_NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+
 def extract_hltb_game_data(
     html_text: str,
     game_id: int,
@@ -539,18 +547,12 @@ def extract_hltb_game_data(
     Returns:
         The game data dict, or ``None`` if extraction failed.
     """
-    import json
-    import re
     from typing import cast
 
-    match = re.search(
-        r'<script id="__NEXT_DATA__".*?>(.*?)</script>',
-        html_text,
-        re.DOTALL,
-    )
+    match = _HLTB_NEXT_DATA_RE.search(html_text)
     if match:
         try:
-            next_data = json.loads(match.group(1))
+            next_data = loads_json(match.group(1))
             # Navigate the nested structure safely
             game_data = (
                 next_data.get("props", {}).get("pageProps", {}).get("game", {}).get("data", {})
@@ -565,6 +567,18 @@ def extract_hltb_game_data(
     return None
 
 
+# Time labels (seconds on HLTB, minutes here) read their '_avg' counterpart, the
+# average completion time shown on the website.
+_HLTB_TIME_LABELS = frozenset(
+    {"comp_main", "comp_plus", "comp_100", "comp_all", "invested_co", "invested_mp"}
+)
+# (output label, source key, convert seconds to minutes), resolved once per process.
+_HLTB_TRANSFORM_PLAN: tuple[tuple[str, str, bool], ...] = tuple(
+    (label, f"{label}_avg", True) if label in _HLTB_TIME_LABELS else (label, label, False)
+    for label in _HOWLONGTOBEAT_LABELS
+)
+
+
 def transform_howlongtobeat(data: dict[str, Any]) -> dict[str, Any]:
     """Transform raw HLTB game data into a normalised dict.
 
@@ -578,32 +592,8 @@ def transform_howlongtobeat(data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Dict with only the valid labels, time values converted to minutes.
     """
-    from typing import cast
-
     result: dict[str, Any] = {}
-    time_labels = {
-        "comp_main",
-        "comp_plus",
-        "comp_100",
-        "comp_all",
-        "invested_co",
-        "invested_mp",
-    }
-    for label in _HOWLONGTOBEAT_LABELS:
-        raw_value: Any = None
-
-        # Map time labels to their '_avg' counterparts (average completion time)
-        if label in ("comp_main", "comp_plus", "comp_100", "comp_all"):
-            avg_label = f"{label}_avg"
-            raw_value = data.get(avg_label)
-        elif label in ("invested_co", "invested_mp"):
-            avg_label = f"{label}_avg"
-            raw_value = data.get(avg_label)
-        else:
-            raw_value = data.get(label, None)
-
-        if raw_value is not None and label in time_labels:
-            result[label] = cast(int, raw_value) // 60
-        else:
-            result[label] = raw_value
+    for label, source_key, is_time in _HLTB_TRANSFORM_PLAN:
+        raw_value = data.get(source_key)
+        result[label] = raw_value // 60 if is_time and raw_value is not None else raw_value
     return result
@@ -182,3 +182,9 @@ class _SearchAuth(NamedTuple):
     hp_val: str
     user_agent: str
     extras: dict[str, str]
+
+
+# HLTB search auth is reused for this many seconds before /api/find/init is called again.
+_HLTB_SEARCH_AUTH_TTL = 600.0
+# Search responses that mean the cached auth was rejected and must be refreshed.
+_HLTB_AUTH_REJECTED_STATUSES = frozenset({401, 403})
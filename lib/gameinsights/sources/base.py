@@ -1,14 +1,13 @@
 import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import Any, Generic, Literal, TypedDict, TypeVar
-from urllib.parse import urljoin
 
 import requests
-from fake_useragent import UserAgent
-from requests.adapters import HTTPAdapter
 from requests.exceptions import (
     ConnectionError,
     InvalidURL,
+    JSONDecodeError,
     RequestException,
     SSLError,
     Timeout,
@@ -22,6 +21,9 @@ from gameinsights.sources._helpers import (
 from gameinsights.sources._helpers import (
     build_error_result as _build_error_result,
 )
+from gameinsights.sources._helpers import (
+    build_request_url as _build_request_url,
+)
 from gameinsights.sources._helpers import (
     fetch_and_parse_json as _fetch_and_parse_json,
 )
@@ -32,6 +34,8 @@ from gameinsights.sources._helpers import (
     prepare_identifier as _prepare_identifier,
 )
 from gameinsights.utils import LoggerWrapper
+from gameinsights.utils.http import create_http_adapter
+from gameinsights.utils.useragent import random_user_agent
 
 T = TypeVar("T")
 
@@ -50,6 +54,33 @@ SourceResult = SuccessResult[dict[str, Any]] | ErrorResult
 
 SYNTHETIC_ERROR_CODE = 599
 
+# Transient transport errors retried by _make_request vs. errors that abort at once.
+_RETRY_EXCEPTIONS = (ConnectionError, Timeout)
+_ABORT_EXCEPTIONS = (InvalidURL, SSLError, TooManyRedirects)
+
+
+@dataclass(slots=True)
+class _SyntheticResponse:
+    """Failed-request stand-in returned by _make_request instead of a requests.Response.
+
+    Exposes the subset of the requests.Response API that sources read; ``.json()``
+    raises the same JSONDecodeError an empty requests.Response body would.
+    """
+
+    url: str
+    reason: str
+    status_code: int = SYNTHETIC_ERROR_CODE
+    headers: dict[str, str] = field(default_factory=dict)
+    content: bytes = b""
+    text: str = ""
+    ok: bool = False
+
+    def json(self) -> Any:
+        raise JSONDecodeError("Expecting value", "", 0)
+
+
+_Response = requests.Response | _SyntheticResponse
+
 
 class BaseSource(ABC):
     _base_url: str | None = None
@@ -66,7 +97,6 @@ class BaseSource(ABC):
         """
         self._logger = LoggerWrapper(self.__class__.__name__)
         self._session = session
-        self._ua = UserAgent()
 
     @property
     def logger(self) -> "LoggerWrapper":
@@ -82,10 +112,7 @@ class BaseSource(ABC):
         """
         if self._session is None:
             self._session = requests.Session()
-            adapter = HTTPAdapter(
-                pool_connections=10,  # Number of connection pools to cache
-                pool_maxsize=20,  # Maximum number of connections per pool
-            )
+            adapter = create_http_adapter()
             self._session.mount("https://", adapter)
             self._session.mount("http://", adapter)
         return self._session
@@ -135,7 +162,7 @@ class BaseSource(ABC):
         retries: int = 3,
         backoff_factor: float = 0.5,
         timeout: float | tuple[float, float] = (30, 60),
-    ) -> requests.Response:
+    ) -> _Response:
         """Default implementation for request.
 
         Args:
@@ -151,26 +178,17 @@ class BaseSource(ABC):
             timeout (float | tuple): Request timeout in seconds
 
         Return:
-            requests.Response: The response of the request call.
+            _Response: The response of the request call, or a _SyntheticResponse on failure.
         """
         source_url = url if url else self._base_url
-        final_url = source_url.rstrip("/")  # type: ignore[union-attr]
-        if endpoint:
-            final_url = urljoin(final_url + "/", endpoint.rstrip("/"))
+        final_url = _build_request_url(source_url, endpoint)  # type: ignore[arg-type]
 
         if headers is None:
-            headers = {"User-Agent": self._ua.random}
+            headers = {"User-Agent": random_user_agent()}
         else:
             if "User-Agent" not in headers:
                 headers = headers.copy()
-                headers["User-Agent"] = self._ua.random
-
-        exception_to_retry = (ConnectionError, Timeout)
-        exception_to_abort = (
-            InvalidURL,
-            SSLError,
-            TooManyRedirects,
-        )
+                headers["User-Agent"] = random_user_agent()
 
         for attempts in range(1, retries + 2):
             try:
@@ -187,7 +205,7 @@ class BaseSource(ABC):
                         data=data,
                         timeout=timeout,
                     )
-            except exception_to_retry as e:
+            except _RETRY_EXCEPTIONS as e:
                 if attempts <= retries:
                     sleep_duration = backoff_factor * (2 ** (attempts - 1))  # the cooldown period
                     self.logger.log(
@@ -199,7 +217,7 @@ class BaseSource(ABC):
                     continue
                 else:
                     return self._create_synthetic_response(url=final_url, reason=str(e))
-            except exception_to_abort as e:
+            except _ABORT_EXCEPTIONS as e:
                 self.logger.log(
                     f"Encounter fatal error {e}. Abort process..",
                     level="error",
@@ -216,15 +234,9 @@ class BaseSource(ABC):
 
         return self._create_synthetic_response(url=final_url, reason="unexpected request error")
 
-    def _create_synthetic_response(self, url: str, reason: str) -> requests.Response:
+    def _create_synthetic_response(self, url: str, reason: str) -> _SyntheticResponse:
         """create a synthetic response to return"""
-        response = requests.Response()
-        response.status_code = SYNTHETIC_ERROR_CODE
-        response._content = b""
-        response.url = url
-        response.reason = reason
-        response.headers = {}  # type: ignore[assignment]
-        return response
+        return _SyntheticResponse(url=url, reason=reason)
 
     @abstractmethod
     def _transform_data(self, data: dict[str, Any]) -> dict[str, Any]:
@@ -250,7 +262,7 @@ class BaseSource(ABC):
 
     def _fetch_and_parse_json(
         self,
-        response: requests.Response,
+        response: _Response,
     ) -> dict[str, Any] | None:
         return _fetch_and_parse_json(response)
 
@@ -7,7 +7,7 @@
 # Please respect their service and consider using official APIs if available.
 #
 # API Strategy:
-# 1. GET /api/find/init - Obtain session token and auth params
+# 1. GET /api/find/init - Obtain session token and auth params (cached for a while)
 # 2. POST /api/find with x-auth-token + x-hp-key/x-hp-val headers - Search for games
 # 3. GET /game/{id} and parse __NEXT_DATA__ - Get full data
 #
@@ -15,18 +15,33 @@
 # ---------------------------
 
 import json
+import threading
+import time
 from typing import Any, cast
 
 import requests
 
+from gameinsights.sources._helpers import loads_json
 from gameinsights.sources._parsers import (
     extract_hltb_game_data,
     generate_search_payload,
     transform_howlongtobeat,
 )
-from gameinsights.sources._schemas import _HOWLONGTOBEAT_LABELS, _SearchAuth
-from gameinsights.sources.base import SYNTHETIC_ERROR_CODE, BaseSource, SourceResult, SuccessResult
+from gameinsights.sources._schemas import (
+    _HLTB_AUTH_REJECTED_STATUSES,
+    _HLTB_SEARCH_AUTH_TTL,
+    _HOWLONGTOBEAT_LABELS,
+    _SearchAuth,
+)
+from gameinsights.sources.base import (
+    SYNTHETIC_ERROR_CODE,
+    BaseSource,
+    SourceResult,
+    SuccessResult,
+    _Response,
+)
 from gameinsights.utils.ratelimit import logged_rate_limited
+from gameinsights.utils.useragent import random_user_agent
 
 
 class HowLongToBeat(BaseSource):
@@ -50,6 +65,9 @@ class HowLongToBeat(BaseSource):
             session: Optional requests.Session for connection pooling.
         """
         super().__init__(session=session)
+        self._search_auth: _SearchAuth | None = None
+        self._search_auth_expires_at = 0.0
+        self._search_auth_lock = threading.Lock()
 
     @logged_rate_limited(calls=60, period=60)  # web scrape -> 60 requests per minute to be polite
     def fetch(
@@ -75,18 +93,26 @@ class HowLongToBeat(BaseSource):
             verbose=verbose,
         )
 
-        # Step 1: Get session auth (token + dynamic params)
-        auth = self._get_search_auth()
+        # Step 1: Get session auth (token + dynamic params), reused across fetches
+        auth = self._get_cached_search_auth()
         if not auth:
             return self._build_error_result("Failed to obtain search token.", verbose=verbose)
 
         # Step 2: Search for the game
         search_response = self._fetch_search_results(game_name, auth)
+        if search_response is not None and (
+            search_response.status_code in _HLTB_AUTH_REJECTED_STATUSES
+        ):
+            # The cached auth was revoked server-side; refresh it and retry once.
+            auth = self._get_cached_search_auth(refresh=True)
+            if not auth:
+                return self._build_error_result("Failed to obtain search token.", verbose=verbose)
+            search_response = self._fetch_search_results(game_name, auth)
         if not search_response:
             return self._build_error_result("Failed to fetch data.", verbose=verbose)
 
         try:
-            search_result = cast(dict[str, Any], json.loads(search_response.text))
+            search_result = cast(dict[str, Any], loads_json(search_response.text))
         except json.JSONDecodeError:
             return self._build_error_result("Failed to parse search response.", verbose=verbose)
 
@@ -125,13 +151,29 @@ class HowLongToBeat(BaseSource):
 
         return SuccessResult(success=True, data=data_packed)
 
+    def _get_cached_search_auth(self, refresh: bool = False) -> _SearchAuth | None:
+        """Return the cached search auth, fetching a new one when missing or expired.
+
+        Args:
+            refresh: If True, discard the cached auth and fetch a new one.
+        """
+        with self._search_auth_lock:
+            if (
+                refresh
+                or self._search_auth is None
+                or time.monotonic() >= self._search_auth_expires_at
+            ):
+                self._search_auth = self._get_search_auth()
+                self._search_auth_expires_at = time.monotonic() + _HLTB_SEARCH_AUTH_TTL
+            return self._search_auth
+
     def _get_search_auth(self) -> _SearchAuth | None:
         """Fetch auth data from the init endpoint.
 
         Returns:
             _SearchAuth with token and auth params, or None if fetching failed.
         """
-        ua = self._ua.random
+        ua = random_user_agent()
         headers = {
             "Accept": "*/*",
             "Referer": self.REFERER_HEADER,
@@ -193,7 +235,7 @@ class HowLongToBeat(BaseSource):
 
         return None
 
-    def _fetch_search_results(self, game_name: str, auth: _SearchAuth) -> requests.Response | None:
+    def _fetch_search_results(self, game_name: str, auth: _SearchAuth) -> _Response | None:
         """Send a search request to HowLongToBeat.
 
         Args:
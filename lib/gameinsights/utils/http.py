@@ -0,0 +1,62 @@
+"""Shared HTTP transport configuration for the sync sources and Collector."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Transient upstream statuses worth retrying on the same connection pool instead of
+# failing the source (and, for the primary source, the whole game).
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Default number of kept-alive connections per host.
+POOL_MAXSIZE = 20
+
+# Longest Retry-After (seconds) honoured inside the adapter. Throttled upstreams can ask
+# for an hour; sleeping that long in adapter.send would stall the worker thread and
+# every Collector sharing its thread-local adapter.
+RETRY_AFTER_MAX = 5.0
+
+
+class _CappedRetry(Retry):
+    """Retry policy that honours Retry-After up to RETRY_AFTER_MAX seconds."""
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+def create_retry() -> Retry:
+    """Build the urllib3 retry policy mounted on every adapter.
+
+    Only status-based retries are enabled here. Connection errors and timeouts are
+    already retried by BaseSource._make_request, so connect/read retries are left at
+    zero to avoid multiplying the two loops. Once the budget is exhausted the last
+    response is returned as-is so sources keep their status-code based handling.
+    Retry-After waits are capped at RETRY_AFTER_MAX.
+    """
+    return _CappedRetry(
+        total=3,
+        connect=0,
+        read=0,
+        status=3,
+        backoff_factor=0.2,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def create_http_adapter(pool_maxsize: int = POOL_MAXSIZE) -> HTTPAdapter:
+    """Build a pooled HTTPAdapter with the shared retry policy."""
+    return HTTPAdapter(
+        pool_connections=10,  # Sufficient for 9 sources across ~5 unique domains
+        pool_maxsize=pool_maxsize,  # Concurrent connections kept alive per domain
+        pool_block=False,  # Don't block when pool is full
+        max_retries=create_retry(),
+    )
@@ -33,4 +33,21 @@ def import_pandas() -> Any:
         ) from None
 
 
-__all__ = ["import_pandas"]
+def import_orjson() -> Any | None:
+    """Lazy-import orjson, returning None if it is not installed.
+
+    Unlike pandas, orjson is only a speedup: callers fall back to the
+    standard library ``json`` module when it is unavailable.
+
+    Returns:
+        The orjson module, or None.
+    """
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        return None
+
+
+__all__ = ["import_orjson", "import_pandas"]
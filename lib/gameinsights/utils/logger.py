@@ -3,9 +3,18 @@ from __future__ import annotations
 import json
 import logging
 import os
+from logging.handlers import MemoryHandler
 from typing import Any
 
 
+def _buffer_capacity() -> int:
+    """Read GAMEINSIGHTS_LOG_BUFFER; 0 (the default) disables buffering."""
+    try:
+        return max(int(os.getenv("GAMEINSIGHTS_LOG_BUFFER", "0")), 0)
+    except ValueError:
+        return 0
+
+
 class LoggerWrapper:
     def __init__(self, name: str) -> None:
         self._logger = logging.getLogger(name)
@@ -15,30 +24,54 @@ class LoggerWrapper:
     def _configure_logger(self) -> None:
         self._logger.propagate = False
         if not self._logger.handlers:
-            handler = logging.StreamHandler()
+            handler: logging.Handler = logging.StreamHandler()
             handler.setFormatter(logging.Formatter("%(levelname)s - %(name)s: %(message)s"))
+            capacity = _buffer_capacity()
+            if capacity:
+                # Batch writes to the stream; errors (and anything after them) flush immediately.
+                handler = MemoryHandler(capacity, flushLevel=logging.ERROR, target=handler)
             self._logger.addHandler(handler)
             self._logger.setLevel(logging.INFO)
 
+    def flush(self) -> None:
+        """Flush any buffered log records to their destination."""
+        for handler in self._logger.handlers:
+            handler.flush()
+
     def log(
-        self, message: str, level: str = "info", verbose: bool = False, **context: Any
+        self,
+        message: str,
+        *args: Any,
+        level: str = "info",
+        verbose: bool = False,
+        **context: Any,
     ) -> None:
         """Log the message at the specified level.
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: Values for the placeholders; interpolated only if the record is emitted.
             level (str): The logging level ('debug', 'info', 'warning', 'error', etc.).
             verbose (bool): If False, will not log the message
         """
         if not verbose:
             return
 
-        formatted = self._format_message(message, context)
-        getattr(self._logger, level.lower())(formatted)
+        log_method = getattr(self._logger, level.lower())
+        if not context:
+            # Let the logging module defer %-interpolation until a handler emits it.
+            log_method(message, *args)
+            return
+
+        if args:
+            message = message % args
+        log_method(self._format_message(message, context))
 
     def log_event(
         self, event: str, level: str = "info", verbose: bool = False, **context: Any
     ) -> None:
         """Emit a structured log event with optional context."""
+        if not verbose:
+            return
         payload = dict(context)
         payload.setdefault("event", event)
         message = payload.pop("message", event)
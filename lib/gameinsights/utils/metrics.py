@@ -5,9 +5,8 @@ import logging
 import os
 import threading
 import time
-from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Iterator
+from typing import Any
 
 
 def _is_enabled() -> bool:
@@ -30,13 +29,23 @@ class TimerResult:
 
 
 class MetricsCollector:
-    """Lightweight metrics collector that emits structured logs when enabled."""
+    """Lightweight metrics collector that emits structured logs when enabled.
 
-    def __init__(self) -> None:
-        self._enabled = _is_enabled()
+    Args:
+        enabled: Whether to emit metrics. Defaults to the GAMEINSIGHTS_METRICS
+            environment variable at construction time.
+    """
+
+    def __init__(self, enabled: bool | None = None) -> None:
+        self._enabled = _is_enabled() if enabled is None else enabled
         self._lock = threading.Lock()
         self._logger = _build_logger()
 
+    @property
+    def enabled(self) -> bool:
+        """Whether this collector emits metrics."""
+        return self._enabled
+
     def _emit(self, metric_type: str, name: str, value: float, labels: dict[str, Any]) -> None:
         if not self._enabled:
             return
@@ -58,16 +67,55 @@ class MetricsCollector:
         """Record an observation (histogram/gauge)."""
         self._emit("observation", name, value, labels)
 
-    @contextmanager
-    def timer(self, name: str, **labels: Any) -> Iterator[TimerResult]:
-        """Context manager to record elapsed seconds for an operation."""
-        result = TimerResult()
-        start = time.perf_counter()
-        try:
-            yield result
-        finally:
-            result.duration = time.perf_counter() - start
-            self.observe(name, result.duration, **labels)
+    def timer(self, name: str, **labels: Any) -> _Stopwatch:
+        """Context manager to record elapsed seconds for an operation.
+
+        When disabled it still measures the duration (callers log it) but
+        emits nothing.
+        """
+        if not self._enabled:
+            return _Stopwatch()
+        return _Timer(self, name, labels)
+
+
+class _Stopwatch:
+    """Class-based timer context; avoids the generator frame of @contextmanager.
+
+    This is what ``timer()`` returns while metrics are disabled: it only fills in
+    the ``TimerResult`` the collectors log and never builds an emit payload.
+    """
+
+    __slots__ = ("_result", "_start")
+
+    def __init__(self) -> None:
+        self._result = TimerResult()
+        self._start = 0.0
+
+    def __enter__(self) -> TimerResult:
+        self._start = time.perf_counter()
+        return self._result
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._result.duration = time.perf_counter() - self._start
+
+
+class _Timer(_Stopwatch):
+    """Stopwatch that also records the duration through ``observe()``.
+
+    Only handed out by ``timer()`` while metrics are enabled.
+    """
+
+    __slots__ = ("_collector", "_name", "_labels")
+
+    def __init__(self, collector: MetricsCollector, name: str, labels: dict[str, Any]) -> None:
+        super().__init__()
+        self._collector = collector
+        self._name = name
+        self._labels = labels
+
+    def __exit__(self, *exc_info: object) -> None:
+        super().__exit__(*exc_info)
+        self._collector.observe(self._name, self._result.duration, **self._labels)
 
 
 metrics = MetricsCollector()
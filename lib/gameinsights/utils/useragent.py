@@ -0,0 +1,35 @@
+"""Process-wide User-Agent rotation shared by the sync and async sources."""
+
+from __future__ import annotations
+
+import random
+import threading
+
+from fake_useragent import UserAgent
+
+# Distinct User-Agent strings kept for rotation. Building a UserAgent loads its browser
+# database (~40ms) and every ``.random`` re-filters it (~4ms), so both are paid only
+# until the pool is full; later requests pick from the pool.
+_POOL_SIZE = 32
+
+_user_agent: UserAgent | None = None
+_pool: list[str] = []
+_lock = threading.Lock()
+
+
+def random_user_agent() -> str:
+    """Return a random browser User-Agent string."""
+    if len(_pool) >= _POOL_SIZE:
+        return random.choice(_pool)
+
+    global _user_agent
+    with _lock:
+        if _user_agent is None:
+            _user_agent = UserAgent()
+        value: str = _user_agent.random
+        if len(_pool) < _POOL_SIZE:
+            _pool.append(value)
+    return value
+
+
+__all__ = ["random_user_agent"]
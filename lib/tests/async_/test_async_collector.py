@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -192,6 +193,14 @@ class TestAsyncCollectorInit:
         assert col._session is None
         assert col._initialized is False
 
+    async def test_session_connector_sized_for_concurrent_games(self) -> None:
+        col = AsyncCollector()
+        await col._ensure_initialized()
+        connector = col._session.connector
+        assert connector.limit == 100
+        assert connector.limit_per_host == 10
+        await col.close()
+
     async def test_ensure_initialized_idempotent(self) -> None:
         col = AsyncCollector()
         await col._ensure_initialized()
@@ -264,6 +273,32 @@ class TestAsyncCollectorGetGamesData:
             await col.get_games_data([], verbose=False, raise_on_error=True)
         await col.close()
 
+    async def test_multiple_appids_fetched_concurrently_in_order(
+        self, mock_all_sources, stub_async_ratelimit
+    ) -> None:
+        col = AsyncCollector(max_concurrency=2)
+        await mock_all_sources(col)
+        in_flight = 0
+        peak = 0
+
+        async def slow_store_fetch(appid: str, verbose: bool = True) -> dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_success({**_BASE_GAME_DATA, "steam_appid": appid})
+
+        col.steamstore.fetch = slow_store_fetch  # type: ignore[method-assign]
+        result = await col.get_games_data(["10", "20", "30", "40"], verbose=False)
+        assert [game["steam_appid"] for game in result] == ["10", "20", "30", "40"]
+        assert peak == 2
+        await col.close()
+
+    async def test_max_concurrency_must_be_positive(self) -> None:
+        with pytest.raises(InvalidRequestError):
+            AsyncCollector(max_concurrency=0)
+
     async def test_recap_mode_returns_subset(self, mock_all_sources) -> None:
         col = AsyncCollector()
         await mock_all_sources(col)
@@ -147,3 +147,24 @@ class TestAsyncHowLongToBeat:
 
         assert result["success"] is True
         assert list(result["data"].keys()) == ["game_name"]
+
+    async def test_async_hltb_reuses_cached_search_auth(self, stub_async_ratelimit) -> None:
+        search_response = _AsyncResponse(status_code=200, _body=_SEARCH_RESPONSE_BODY)
+        get_auth = AsyncMock(return_value=_MOCK_AUTH)
+
+        with (
+            patch.object(AsyncHowLongToBeat, "_get_search_auth", get_auth),
+            patch.object(
+                AsyncHowLongToBeat,
+                "_fetch_search_results",
+                AsyncMock(return_value=search_response),
+            ),
+            patch.object(
+                AsyncHowLongToBeat, "_fetch_game_page", AsyncMock(return_value=_GAME_PAGE_DATA)
+            ),
+        ):
+            src = AsyncHowLongToBeat()
+            await src.fetch("First", verbose=False)
+            await src.fetch("Second", verbose=False)
+
+        assert get_auth.await_count == 1
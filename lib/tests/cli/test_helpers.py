@@ -65,6 +65,16 @@ class TestReadAppids:
 
         assert appids == ["12345", "67890", "42", "100", "200"]
 
+    def test_read_appids_keeps_first_occurrence_order(self, tmp_path):
+        """Test that dedup order follows the input, not str hashing (PYTHONHASHSEED)."""
+        tokens = [chr(code) * 3 for code in range(ord("z"), ord("a") - 1, -1)]
+        appid_file = tmp_path / "appids.txt"
+        appid_file.write_text(",".join(tokens + tokens[::-1]))
+
+        appids = cli._read_appids([tokens[5]], str(appid_file))
+
+        assert appids == [tokens[5]] + tokens[:5] + tokens[6:]
+
     def test_read_appids_file_not_found(self, tmp_path):
         """Test handling when appid file doesn't exist."""
         non_existent = tmp_path / "does_not_exist.txt"
@@ -166,6 +176,7 @@ class TestFilterRecords:
         filtered = cli._filter_records(records, allowed_fields)
 
         assert filtered == records
+        assert filtered[0] is records[0]
 
     def test_filter_records_missing_fields(self):
         """Test filtering when some records don't have all allowed fields."""
@@ -184,6 +195,23 @@ class TestFilterRecords:
         assert "steam_appid" in filtered[1]
         assert "name" not in filtered[1]
 
+    def test_filter_records_preserves_key_order(self):
+        """Test that kept keys stay in record order, across differing key layouts."""
+        records = [
+            {"price": 10.0, "name": "Game 1", "secret": "x", "steam_appid": "12345"},
+            {"steam_appid": "67890", "secret": "y", "name": "Game 2"},
+            {"price": 30.0, "name": "Game 3", "secret": "z", "steam_appid": "42"},
+        ]
+
+        filtered = cli._filter_records(records, {"steam_appid", "name", "price"})
+
+        assert [list(record) for record in filtered] == [
+            ["price", "name", "steam_appid"],
+            ["steam_appid", "name"],
+            ["price", "name", "steam_appid"],
+        ]
+        assert filtered[2] == {"price": 30.0, "name": "Game 3", "steam_appid": "42"}
+
     def test_filter_records_empty_list(self):
         """Test filtering empty records list."""
         filtered = cli._filter_records([], {"steam_appid"})
@@ -2,20 +2,12 @@
 
 import json
 from pathlib import Path
-from typing import Iterator
 
 import pytest
-from tests.fixtures.cli_fixtures import DummyCollector
 
 from gameinsights import cli
 
 
-@pytest.fixture
-def patched_collector(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
-    monkeypatch.setattr(cli, "Collector", DummyCollector)
-    yield
-
-
 class TestCLIOutputFormats:
     """Tests for CLI output format variations."""
 
@@ -45,6 +37,39 @@ class TestCLIOutputFormats:
         assert "Collecting data for 1 appid(s)..." in captured.err
         assert captured.out == ""
 
+    def test_cli_collect_games_csv_streams_from_iter_games_data(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, patched_collector
+    ) -> None:
+        """CSV rows come from iter_games_data one game at a time; failures are skipped."""
+        from gameinsights._collector_utils import FetchResult
+
+        def iter_games_data(self, steam_appids, recap=False, verbose=True):
+            for appid in steam_appids:
+                if appid == "2":
+                    yield FetchResult(identifier=appid, success=False, error="not found")
+                else:
+                    yield FetchResult(
+                        identifier=appid,
+                        success=True,
+                        data={"steam_appid": appid, "name": f"Game {appid}", "secret": "x"},
+                    )
+
+        def get_games_data(self, *args, **kwargs):
+            raise AssertionError("CSV output must not materialise the whole batch")
+
+        monkeypatch.setattr(cli.Collector, "iter_games_data", iter_games_data)
+        monkeypatch.setattr(cli.Collector, "get_games_data", get_games_data)
+        output_path = tmp_path / "output.csv"
+
+        argv = ["collect", "-a", "1", "-a", "2", "-a", "3", "-s", "steamstore", "-F", "csv"]
+        assert cli.main([*argv, "--output", str(output_path)]) == 0
+
+        assert output_path.read_text(encoding="utf-8").splitlines() == [
+            "steam_appid,name",
+            "1,Game 1",
+            "3,Game 3",
+        ]
+
     def test_cli_collect_with_recap(
         self, capsys: pytest.CaptureFixture[str], patched_collector
     ) -> None:
@@ -89,3 +114,69 @@ class TestCLIOutputFormats:
         # Stdout should have progress message but not data
         assert "Collecting data" in captured.err
         assert captured.out == ""
+
+
+class TestCLIJsonRendering:
+    """Tests for JSON rendering with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_render_json_matches_stdlib(self, monkeypatch: pytest.MonkeyPatch, use_orjson):
+        """Rendered JSON round-trips identically whichever encoder is used."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(cli, "import_orjson", lambda: None)
+
+        payload = [{"steam_appid": "12345", "name": "Mock Game", "tags": ["RPG"], "price": 9.99}]
+        rendered = cli._render_json(payload)
+
+        assert json.loads(rendered) == payload
+        assert rendered.startswith("[\n  {")
+        assert cli._render_json_bytes(payload) == rendered.encode("utf-8")
+
+    def test_cli_json_file_same_bytes_with_and_without_orjson(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, patched_collector
+    ) -> None:
+        """Non-ASCII names and non-finite floats are written identically on both paths."""
+        pytest.importorskip("orjson")
+        records = [{"steam_appid": "1", "name": "Café ™ 原神", "price_final": float("nan")}]
+        monkeypatch.setattr(cli.Collector, "get_games_data", lambda self, *a, **kw: records)
+
+        def collect(output: Path) -> bytes:
+            argv = ["collect", "--appid", "1", "--format", "json", "--output", str(output)]
+            assert cli.main(argv) == 0
+            return output.read_bytes()
+
+        with_orjson = collect(tmp_path / "orjson.json")
+        monkeypatch.setattr(cli, "import_orjson", lambda: None)
+        without_orjson = collect(tmp_path / "stdlib.json")
+
+        assert without_orjson == with_orjson
+        assert "原神".encode() in without_orjson
+        assert json.loads(without_orjson)[0]["price_final"] is None
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_cli_json_stdout_with_non_utf8_console(
+        self, monkeypatch: pytest.MonkeyPatch, patched_collector, use_orjson
+    ) -> None:
+        """Non-ASCII names reach a non-UTF-8 stdout as UTF-8 bytes instead of raising."""
+        import io
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(cli, "import_orjson", lambda: None)
+        records = [{"steam_appid": "1", "name": "Café ™ 原神"}]
+        monkeypatch.setattr(cli.Collector, "get_games_data", lambda self, *a, **kw: records)
+        console = io.TextIOWrapper(io.BytesIO(), encoding="cp1252")
+        monkeypatch.setattr(cli.sys, "stdout", console)
+
+        assert cli.main(["collect", "--appid", "1", "--format", "json"]) == 0
+
+        assert json.loads(console.buffer.getvalue().decode("utf-8")) == records
+
+    def test_render_json_falls_back_on_unsupported_types(self):
+        """Payloads orjson rejects are still rendered by the stdlib encoder."""
+        payload = [{1: "non-str key"}]
+
+        assert json.loads(cli._render_json(payload)) == [{"1": "non-str key"}]
@@ -0,0 +1,18 @@
+"""Shared fixtures for Collector tests."""
+
+import pytest
+
+from gameinsights.sources import HowLongToBeat
+from gameinsights.sources._schemas import _SearchAuth
+
+
+@pytest.fixture(autouse=True)
+def _mock_hltb_token(monkeypatch):
+    """Centralized mock for HowLongToBeat search auth so no test hits the init endpoint."""
+    monkeypatch.setattr(
+        HowLongToBeat,
+        "_get_search_auth",
+        lambda *a, **kw: _SearchAuth(
+            token="mock_token", hp_key="hpKey", hp_val="mock_val", user_agent="mock_ua", extras={}
+        ),
+    )
@@ -95,3 +95,65 @@ class TestCollectorDataFrame:
         assert isinstance(results, list)
         assert len(results) == 1
         assert_fetch_result(results[0], "12345")
+
+    def test_get_games_active_player_data_dataframe_matches_list(
+        self, collector_with_mocks, monkeypatch
+    ):
+        """DataFrame and list paths agree, including rows for failed appids."""
+
+        def fake_fetch(appid, verbose=True, selected_labels=None):
+            if appid == "2":
+                return {"success": False, "error": "Failed to fetch data."}
+            return {
+                "success": True,
+                "data": {
+                    "name": "Game",
+                    "peak_active_player_all_time": 100,
+                    "monthly_active_player": [
+                        {"month": "2024-01", "average_players": 10.5},
+                        {"month": "2024-02", "average_players": 12.0},
+                    ],
+                },
+            }
+
+        monkeypatch.setattr(collector_with_mocks.steamcharts, "fetch", fake_fetch)
+
+        rows = collector_with_mocks.get_games_active_player_data(steam_appids=["1", "2"])
+        df = collector_with_mocks.get_games_active_player_data(
+            steam_appids=["1", "2"], return_as="dataframe"
+        )
+
+        pd.testing.assert_frame_equal(df, pd.DataFrame(rows, columns=list(df.columns)))
+        assert df["peak_active_player_all_time"].tolist() == [100, -1]
+        assert pd.api.types.is_integer_dtype(df["peak_active_player_all_time"])
+
+
+class TestBuildActivePlayerFrame:
+    """Dtypes and values of the active-player frame for missing peaks."""
+
+    RECORDS = [
+        {"steam_appid": "1", "name": "Game 1", "peak_active_player_all_time": 10, "2024-01": 5.5},
+        {"steam_appid": "2", "name": "Game 2", "2024-01": 1.0},
+        {"steam_appid": "3", "name": None, "peak_active_player_all_time": None},
+    ]
+
+    @pytest.mark.parametrize(
+        "fill_na_as, peak_dtype, peaks",
+        [(-1, "int64", [10, -1, -1]), (0.5, "float64", [10.0, 0.5, 0.5])],
+    )
+    def test_missing_or_none_peak_follows_fill_value(self, fill_na_as, peak_dtype, peaks):
+        from gameinsights._collector_utils import (
+            build_active_player_frame,
+            normalize_active_player_rows,
+        )
+
+        records = [dict(record) for record in self.RECORDS]
+        df = build_active_player_frame(pd, records, {"2024-01"}, fill_na_as)
+
+        assert df["peak_active_player_all_time"].dtype == peak_dtype
+        assert df["peak_active_player_all_time"].tolist() == peaks
+        assert df["2024-01"].tolist() == [5.5, 1.0, fill_na_as]
+
+        # Same dtypes as a frame built from the normalized list output.
+        rows, *_ = normalize_active_player_rows(records, {"2024-01"}, fill_na_as)
+        pd.testing.assert_frame_equal(df, pd.DataFrame(rows, columns=list(df.columns)))
@@ -9,8 +9,6 @@ from gameinsights import (
     InvalidRequestError,
     SourceUnavailableError,
 )
-from gameinsights.sources import HowLongToBeat
-from gameinsights.sources._schemas import _SearchAuth
 
 
 class TestCollectorErrorClassification:
@@ -86,24 +84,20 @@ class TestCollectorErrorClassification:
         for attr, value in expected_attrs.items():
             assert getattr(exc, attr) == value
 
+    def test_repeated_message_returns_fresh_exception_per_source(self):
+        """Cached classification still builds a new exception with the caller's source."""
+        message = "Connection timeout"
+        first = Collector._classify_source_error("SteamSpy", message)
+        second = Collector._classify_source_error("ProtonDB", message)
+
+        assert first is not second
+        assert first.source == "SteamSpy"
+        assert second.source == "ProtonDB"
+
 
 class TestRaiseForFetchFailure:
     """Test _raise_for_fetch_failure method."""
 
-    @pytest.fixture(autouse=True)
-    def _mock_hltb_token(self, monkeypatch):
-        monkeypatch.setattr(
-            HowLongToBeat,
-            "_get_search_auth",
-            lambda *a, **kw: _SearchAuth(
-                token="mock_token",
-                hp_key="hpKey",
-                hp_val="mock_val",
-                user_agent="mock_ua",
-                extras={},
-            ),
-        )
-
     def test_primary_source_not_found_raises_game_not_found(self):
         """Test primary source 'not found' raises GameNotFoundError."""
         collector = Collector()
@@ -140,20 +134,6 @@ class TestRaiseForFetchFailure:
 class TestRaiseOnErrorParameter:
     """Test raise_on_error parameter in public methods."""
 
-    @pytest.fixture(autouse=True)
-    def _mock_hltb_token(self, monkeypatch):
-        monkeypatch.setattr(
-            HowLongToBeat,
-            "_get_search_auth",
-            lambda *a, **kw: _SearchAuth(
-                token="mock_token",
-                hp_key="hpKey",
-                hp_val="mock_val",
-                user_agent="mock_ua",
-                extras={},
-            ),
-        )
-
     def test_get_games_data_empty_input_with_raise_on_error(self):
         """Test get_games_data with empty input and raise_on_error=True."""
         collector = Collector()
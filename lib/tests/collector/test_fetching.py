@@ -1,5 +1,7 @@
 """Tests for Collector data fetching functionality."""
 
+import threading
+
 import pytest
 
 from gameinsights.model import GameDataModel
@@ -79,3 +81,87 @@ class TestCollectorFetching:
                 assert (
                     field in model_fields
                 ), f"Field '{field}' from {config.source.__class__.__name__} not in GameDataModel"
+
+    def test_id_based_sources_fetched_concurrently(self, collector_with_mocks, monkeypatch):
+        """ID-based sources for one game run on the executor, not the caller thread."""
+        collector = collector_with_mocks
+        caller_thread = threading.get_ident()
+        worker_threads = set()
+        original = collector._fetch_with_observability
+
+        def tracking_fetch(source, identifier, scope, verbose):
+            if scope == "id":
+                worker_threads.add(threading.get_ident())
+            return original(source, identifier=identifier, scope=scope, verbose=verbose)
+
+        monkeypatch.setattr(collector, "_fetch_with_observability", tracking_fetch)
+
+        raw_data = collector._fetch_raw_data(steam_appid="12345")
+
+        assert raw_data.steam_appid == "12345"
+        assert worker_threads
+        assert caller_thread not in worker_threads
+
+    def test_close_shuts_down_executor(self, collector_with_mocks):
+        """close() releases the fan-out thread pool."""
+        collector = collector_with_mocks
+        collector._fetch_raw_data(steam_appid="12345")
+        executor = collector._executor
+        assert executor is not None
+
+        collector.close()
+
+        assert collector._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+    def test_response_cache_reuses_successful_source_results(
+        self, collector_with_mocks, monkeypatch
+    ):
+        """With cache_ttl set, repeated appids are served without refetching."""
+        from gameinsights import Collector
+        from gameinsights.sources import SteamStore
+
+        calls = []
+        original_fetch = SteamStore.fetch
+
+        def counting_fetch(self, *args, **kwargs):
+            calls.append(args)
+            return original_fetch(self, *args, **kwargs)
+
+        monkeypatch.setattr(SteamStore, "fetch", counting_fetch)
+
+        with Collector(cache_ttl=60) as collector:
+            first = collector.get_games_data(steam_appids=["12345", "12345"])
+            assert len(calls) == 1
+            assert first[0] == first[1]
+
+            # A region change invalidates responses fetched for the old region.
+            collector.region = "uk"
+            collector.get_games_data(steam_appids="12345")
+            assert len(calls) == 2
+
+    def test_response_cache_entries_are_not_shared_with_callers(self, collector_with_mocks):
+        """Mutating a returned result does not leak into later cache hits."""
+        from unittest.mock import patch
+
+        from gameinsights import Collector
+
+        payload = {"success": True, "data": {"steam_appid": "12345", "genres": ["Action"]}}
+        with Collector(cache_ttl=60) as collector:
+            source = collector.steamstore
+            with patch.object(source, "fetch", return_value=payload) as fetch:
+                first = collector._fetch_with_observability(source, "12345", "id", False)
+                first["data"]["genres"].append("Mutated")
+
+                second = collector._fetch_with_observability(source, "12345", "id", False)
+                assert second["data"]["genres"] == ["Action"]
+                second["data"]["genres"].clear()
+                third = collector._fetch_with_observability(source, "12345", "id", False)
+
+        assert fetch.call_count == 1
+        assert third["data"]["genres"] == ["Action"]
+
+    def test_response_cache_disabled_by_default(self, collector_with_mocks):
+        """Without cache_ttl, no response cache is allocated."""
+        assert collector_with_mocks._response_cache is None
@@ -1,77 +1,12 @@
 """Tests for Collector metrics emission and observability."""
 
+import logging
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from gameinsights.sources import HowLongToBeat
-from gameinsights.sources._schemas import _SearchAuth
-
-
-@pytest.fixture(autouse=True)
-def _mock_hltb_token(monkeypatch):
-    """Centralized mock for HowLongToBeat token to reduce repetition."""
-    monkeypatch.setattr(
-        HowLongToBeat,
-        "_get_search_auth",
-        lambda *a, **kw: _SearchAuth(
-            token="mock_token", hp_key="hpKey", hp_val="mock_val", user_agent="mock_ua", extras={}
-        ),
-    )
-
-
-@pytest.fixture
-def reload_and_restore_metrics(monkeypatch):
-    """Reload metrics module with GAMEINSIGHTS_METRICS unset and restore on teardown.
-
-    This fixture ensures test isolation by:
-    1. Capturing the original metrics module state and env var value
-    2. Unsetting GAMEINSIGHTS_METRICS and reloading the module
-    3. Reloading gameinsights.utils to rebind the new metrics instance
-    4. Restoring the original env var and module state after the test
-    """
-    import importlib
-    import os
-    import sys
-
-    # Capture the original modules
-    original_metrics_module = sys.modules.get("gameinsights.utils.metrics")
-    original_utils_module = sys.modules.get("gameinsights.utils")
-
-    # Capture the original env var value
-    original_env_value = os.environ.get("GAMEINSIGHTS_METRICS")
-
-    # Ensure metrics are disabled by unsetting the environment variable
-    monkeypatch.delenv("GAMEINSIGHTS_METRICS", raising=False)
-
-    # Force recreation of metrics module with disabled state
-    if "gameinsights.utils.metrics" in sys.modules:
-        importlib.reload(sys.modules["gameinsights.utils.metrics"])
-
-    # Reload gameinsights.utils to rebind the new metrics instance
-    # This is necessary because gameinsights.utils imports metrics at module level
-    if "gameinsights.utils" in sys.modules:
-        importlib.reload(sys.modules["gameinsights.utils"])
-
-    yield
-
-    # Teardown: restore the original env var first, before reloading modules
-    if original_env_value is not None:
-        os.environ["GAMEINSIGHTS_METRICS"] = original_env_value
-    else:
-        os.environ.pop("GAMEINSIGHTS_METRICS", None)
-
-    # Restore the original module state with the correct env in place
-    if original_metrics_module is not None:
-        sys.modules["gameinsights.utils.metrics"] = original_metrics_module
-    if original_utils_module is not None:
-        sys.modules["gameinsights.utils"] = original_utils_module
-
-    # Reload with the original env var value restored
-    if original_utils_module is not None:
-        importlib.reload(original_utils_module)
-    elif original_metrics_module is not None:
-        importlib.reload(original_metrics_module)
+from gameinsights import Collector
+from gameinsights.utils import metrics
 
 
 class TestCollectorMetrics:
@@ -86,16 +21,33 @@ class TestCollectorMetrics:
 
     @pytest.fixture
     def collector_with_mocked_metrics(self, mock_metrics):
-        """Create a Collector instance with mocked metrics."""
-        from gameinsights import Collector
-        from gameinsights.utils import metrics
-
+        """Create a Collector instance with metrics enabled and mocked."""
         with (
+            patch.object(metrics, "_enabled", True),
             patch.object(metrics, "counter", mock_metrics["counter"]),
             patch.object(metrics, "timer", mock_metrics["timer"]),
         ):
             yield Collector()
 
+    def test_counters_skipped_when_metrics_disabled(self, mock_metrics):
+        """With metrics disabled, fetches do not build or emit counter labels."""
+        collector = Collector()
+        with (
+            patch.object(metrics, "_enabled", False),
+            patch.object(metrics, "counter", mock_metrics["counter"]),
+            patch.object(
+                collector.steamstore,
+                "fetch",
+                return_value={"success": True, "data": {"steam_appid": "12345"}},
+            ),
+        ):
+            result = collector._fetch_with_observability(
+                collector.steamstore, identifier="12345", scope="id", verbose=False
+            )
+
+        assert result["success"] is True
+        assert not mock_metrics["counter"].called
+
     def test_metrics_emitted_on_success(self, collector_with_mocked_metrics, mock_metrics):
         """Test that metrics are emitted on successful fetch."""
         # Mock a successful source fetch
@@ -157,16 +109,15 @@ class TestCollectorMetrics:
         # Verify exception metrics were emitted
         assert mock_metrics["counter"].called
 
-    def test_metrics_disabled_when_none(self, caplog, reload_and_restore_metrics):
-        """Test that metrics are not emitted when GAMEINSIGHTS_METRICS is not set."""
-        import logging
-
-        from gameinsights import Collector
-
+    def test_metrics_disabled_when_none(self, caplog):
+        """Test that metrics are not emitted when the collector is disabled."""
         collector = Collector()
 
         # Capture logs from the metrics logger
-        with caplog.at_level(logging.INFO, logger="gameinsights.metrics"):
+        with (
+            patch.object(metrics, "_enabled", False),
+            caplog.at_level(logging.INFO, logger="gameinsights.metrics"),
+        ):
             # Mock a successful fetch
             with patch.object(
                 collector.steamstore,
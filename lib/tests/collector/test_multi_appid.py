@@ -1,10 +1,12 @@
 """Tests for Collector with multiple appids and mixed success/failure scenarios."""
 
-from unittest.mock import patch
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from gameinsights import Collector, GameNotFoundError
+from gameinsights import Collector, GameNotFoundError, InvalidRequestError
+from gameinsights.model import game_data
 from gameinsights.sources._schemas import _SearchAuth
 
 
@@ -91,6 +93,127 @@ class TestMultiAppidScenarios:
         assert result[0]["steam_appid"] == "12345"
         assert result[1]["steam_appid"] == "12345"
 
+    @pytest.mark.parametrize("container", [list, tuple])
+    def test_get_games_data_deduplicate_fetches_each_appid_once(
+        self, collector_with_mocks, container
+    ):
+        """With deduplicate=True repeated appids are fetched once and expanded in place."""
+        with patch.object(
+            collector_with_mocks,
+            "_fetch_raw_data",
+            wraps=collector_with_mocks._fetch_raw_data,
+        ) as fetch_spy:
+            data, results = collector_with_mocks.get_games_data(
+                container(["12345", "12345", "12345"]), include_failures=True, deduplicate=True
+            )
+
+        assert fetch_spy.call_count == 1
+        assert [r.identifier for r in results] == ["12345", "12345", "12345"]
+        assert data[0] == data[1] == data[2]
+        assert data[0] is not data[1]
+
+    def test_iter_games_data_yields_lazily_in_order(self, collector_with_mocks):
+        """iter_games_data fetches one appid per step and matches get_games_data."""
+        with patch.object(
+            collector_with_mocks,
+            "_fetch_raw_data",
+            wraps=collector_with_mocks._fetch_raw_data,
+        ) as fetch_spy:
+            stream = collector_with_mocks.iter_games_data(["12345", "12345"], recap=True)
+            assert fetch_spy.call_count == 0
+
+            first = next(stream)
+            assert fetch_spy.call_count == 1
+            rest = list(stream)
+
+        results = [first, *rest]
+        assert [r.identifier for r in results] == ["12345", "12345"]
+        assert all(r.success for r in results)
+        assert [r.data for r in results] == collector_with_mocks.get_games_data(
+            ["12345", "12345"], recap=True
+        )
+
+    def test_max_concurrency_overlaps_games_and_keeps_input_order(self):
+        """With max_concurrency > 1 games run at once, in input order, under pinned_today."""
+        collector = Collector(max_concurrency=2)
+        both_in_flight = threading.Barrier(2, timeout=5)
+        pinned = []
+
+        def fake_fetch(appid, verbose=True, raise_on_primary_failure=False):
+            if appid in ("1", "2"):
+                both_in_flight.wait()
+            pinned.append(game_data._TODAY_ORDINAL.get())
+            model = MagicMock()
+            model.get_recap.return_value = {"steam_appid": appid}
+            return model
+
+        with patch.object(collector, "_fetch_raw_data", side_effect=fake_fetch):
+            result = collector.get_games_data(["1", "2", "3"], recap=True, verbose=False)
+
+        collector.close()
+        assert result == [{"steam_appid": "1"}, {"steam_appid": "2"}, {"steam_appid": "3"}]
+        assert len(pinned) == 3 and None not in pinned
+
+    def test_max_concurrency_raise_on_error_stops_at_first_failure(self):
+        """A primary failure propagates in input order and later appids are not submitted."""
+        collector = Collector(max_concurrency=2)
+        fetched = []
+
+        def fake_fetch(appid, verbose=True, raise_on_primary_failure=False):
+            fetched.append(appid)
+            if appid == "2":
+                raise GameNotFoundError(identifier=appid)
+            model = MagicMock()
+            model.get_recap.return_value = {"steam_appid": appid}
+            return model
+
+        stream = collector.iter_games_data(
+            ["1", "2", "3", "4", "5"], recap=True, verbose=False, raise_on_error=True
+        )
+        with patch.object(collector, "_fetch_raw_data", side_effect=fake_fetch):
+            assert next(stream).identifier == "1"
+            with pytest.raises(GameNotFoundError):
+                next(stream)
+
+        collector.close()
+        assert "5" not in fetched
+
+    def test_max_concurrency_active_player_data_keeps_input_order(self, collector_with_mocks):
+        """Active-player rows keep input order when fetched concurrently."""
+        collector_with_mocks.max_concurrency = 3
+        appids = ["12345", "12345", "12345"]
+
+        data, results = collector_with_mocks.get_games_active_player_data(
+            appids, include_failures=True
+        )
+
+        assert [r.identifier for r in results] == appids
+        assert len(data) == 3
+
+    def test_source_executor_created_once_across_game_workers(self):
+        """Concurrent game workers all get the same lazily created source pool."""
+        collector = Collector(max_concurrency=8)
+        start = threading.Barrier(8, timeout=5)
+        executors = []
+
+        def get_executor():
+            start.wait()
+            executors.append(collector._get_executor())
+
+        workers = [threading.Thread(target=get_executor) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        collector.close()
+        assert len({id(executor) for executor in executors}) == 1
+
+    def test_max_concurrency_must_be_positive(self):
+        """max_concurrency below 1 is rejected."""
+        with pytest.raises(InvalidRequestError):
+            Collector(max_concurrency=0)
+
     def test_get_games_data_empty_list_with_raise_on_error(self, monkeypatch):
         """Test get_games_data with empty list and raise_on_error=True."""
         from gameinsights import InvalidRequestError
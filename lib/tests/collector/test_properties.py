@@ -1,23 +1,6 @@
 """Tests for Collector property setters and configuration."""
 
-import pytest
-
 from gameinsights import Collector
-from gameinsights.sources._schemas import _SearchAuth
-
-
-@pytest.fixture(autouse=True)
-def _mock_hltb_token(monkeypatch):
-    """Centralized mock for HowLongToBeat token to avoid repetition."""
-    from gameinsights.sources import HowLongToBeat
-
-    monkeypatch.setattr(
-        HowLongToBeat,
-        "_get_search_auth",
-        lambda *a, **kw: _SearchAuth(
-            token="mock_token", hp_key="hpKey", hp_val="mock_val", user_agent="mock_ua", extras={}
-        ),
-    )
 
 
 class TestCollectorProperties:
@@ -102,3 +85,14 @@ class TestCollectorConfiguration:
         assert collector.language == "japanese"
         assert collector.steamstore.region == "jp"
         assert collector.steamstore.language == "japanese"
+
+    def test_source_field_lists_shared_across_instances(self):
+        """Field tuples are module-level constants, not rebuilt per collector."""
+        first, second = Collector(), Collector()
+
+        for a, b in zip(
+            first.id_based_sources + first.name_based_sources,
+            second.id_based_sources + second.name_based_sources,
+        ):
+            assert isinstance(a.fields, tuple)
+            assert a.fields is b.fields
@@ -176,3 +176,32 @@ class TestGetUserData:
         import pandas as pd
 
         assert not isinstance(result, pd.DataFrame)
+
+    def test_get_user_data_uses_rate_limiter_instead_of_sleep(self, monkeypatch, stub_ratelimit):
+        """Users are throttled by the collector's limiter, not a fixed sleep."""
+        from gameinsights.sources import HowLongToBeat, SteamUser
+
+        def mock_get_token(*args, **kwargs):
+            return _SearchAuth(
+                token="mock_token",
+                hp_key="hpKey",
+                hp_val="mock_val",
+                user_agent="mock_ua",
+                extras={},
+            )
+
+        monkeypatch.setattr(HowLongToBeat, "_get_search_auth", mock_get_token)
+
+        mock_response = {
+            "success": True,
+            "data": {"steamid": "76561198000000000", "nickname": "TestUser"},
+        }
+
+        with patch.object(SteamUser, "fetch", return_value=mock_response):
+            with patch("time.sleep") as mock_sleep:
+                collector = Collector()
+                result = collector.get_user_data(["1", "2", "3"], return_as="list")
+
+        assert len(result) == 3
+        mock_sleep.assert_not_called()
+        assert stub_ratelimit.limits_invocations == 1
@@ -8,6 +8,7 @@ import requests
 
 # Import all fixtures from tests/fixtures/ directory
 # Pytest will automatically make these available to all tests
+from tests.fixtures.cli_fixtures import patched_collector  # noqa: F401
 from tests.fixtures.hltb_fixtures import *  # noqa: F403
 from tests.fixtures.model_fixtures import *  # noqa: F403
 from tests.fixtures.protondb_fixtures import *  # noqa: F403
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
 
+import pytest
+
+from gameinsights import cli
 from gameinsights._collector_utils import FetchResult
 from gameinsights.collector import SourceConfig
 
@@ -17,7 +20,7 @@ class DummyCollector:
     """Minimal Collector stand-in for CLI tests.
 
     Supports the public surface used by ``cli.main``:
-    ``get_games_data``, ``get_games_active_player_data``,
+    ``get_games_data``, ``iter_games_data``, ``get_games_active_player_data``,
     ``id_based_sources``, ``name_based_sources``, context-manager
     protocol, and ``close``.
     """
@@ -65,6 +68,16 @@ class DummyCollector:
             ]
         return self._records
 
+    def iter_games_data(
+        self,
+        steam_appids: str | list[str],
+        recap: bool = False,
+        verbose: bool = True,
+        raise_on_error: bool = False,
+    ) -> Iterator[FetchResult]:
+        for record in self.get_games_data(steam_appids, recap=recap):  # type: ignore[union-attr]
+            yield FetchResult(identifier=record["steam_appid"], success=True, data=record)
+
     def get_games_active_player_data(
         self,
         steam_appids: list[str],
@@ -105,3 +118,10 @@ class DummyCollector:
 
     def __exit__(self, *args: object) -> None:
         self.close()
+
+
+@pytest.fixture
+def patched_collector(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Swap cli.Collector for DummyCollector for the duration of a test."""
+    monkeypatch.setattr(cli, "Collector", DummyCollector)
+    yield
@@ -171,6 +171,18 @@ class TestGameDataModel:
         assert isinstance(recap["release_date"], str)
         assert recap["release_date"] == "2025-01-01T00:00:00"
 
+    def test_game_data_model_get_recap_matches_model_dump(self, raw_data_normal):
+        """get_recap() mirrors model_dump(mode="json") restricted to recap fields."""
+        model = GameDataModel(**raw_data_normal)
+        recap = model.get_recap()
+
+        expected = model.model_dump(mode="json", include=model._RECAP_FIELDS)
+        assert recap == expected
+        assert list(recap) == list(expected)
+
+        recap["tags"].append("Mutated")
+        assert "Mutated" not in model.tags
+
     def test_game_data_model_float_fields_default_to_none(self):
         """Verify float fields default to None."""
         model = GameDataModel(steam_appid="test")
@@ -3,6 +3,8 @@
 import datetime
 import json
 
+import pytest
+
 from gameinsights.model.game_data import GameDataModel
 
 
@@ -77,6 +79,27 @@ class TestValidatorsEdgeCases:
         # Invalid dates should be converted to None
         assert model.release_date is None
 
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("2023-06-15", datetime.datetime(2023, 6, 15)),
+            ("Jun 15, 2023", datetime.datetime(2023, 6, 15)),
+            ("Jun 5, 2023", datetime.datetime(2023, 6, 5)),
+            ("2023-6-5", datetime.datetime(2023, 6, 5)),
+            ("JUN 15, 2023", datetime.datetime(2023, 6, 15)),
+            ("Jun  15,  2023", datetime.datetime(2023, 6, 15)),
+            ("Coming soon", None),
+            ("Foo 15, 2023", None),
+            ("Feb 30, 2023", None),
+            ("2023-13-01", None),
+        ],
+    )
+    def test_parse_release_date_formats(self, raw, expected):
+        """Accepted layouts match what strptime accepted for the two formats."""
+        model = GameDataModel(steam_appid="test", release_date=raw)
+
+        assert model.release_date == expected
+
     def test_parse_release_date_with_empty_string(self):
         """Test that empty string for date is handled."""
         model = GameDataModel(
@@ -175,3 +198,50 @@ class TestJSONSerializationEdgeCases:
         # Should be JSON serializable
         json_str = json.dumps(json_dict)
         assert '"price_final": null' in json_str
+
+    def test_normalize_fields_does_not_mutate_input(self):
+        """Coercion works on a copy; the caller's raw dict is left untouched."""
+        raw = {"steam_appid": 570, "ccu": "100", "tags": "RPG", "price_final": "inf"}
+
+        model = GameDataModel(**raw)
+
+        assert model.steam_appid == "570"
+        assert model.ccu == 100
+        assert model.tags == ["RPG"]
+        assert model.price_final is None
+        assert raw == {"steam_appid": 570, "ccu": "100", "tags": "RPG", "price_final": "inf"}
+
+    def test_handle_integers_with_non_finite_float(self):
+        """Non-finite floats cannot become ints and are treated as missing."""
+        model = GameDataModel(steam_appid="test", owners=float("inf"), ccu=float("nan"))
+
+        assert model.owners is None
+        assert model.ccu is None
+
+    def test_pinned_today_fixes_days_since_release(self, monkeypatch):
+        """Models built inside pinned_today() share one clock read."""
+        from gameinsights.model import game_data
+
+        release = datetime.datetime(2025, 1, 1)
+        with game_data.pinned_today():
+            pinned = game_data._TODAY_ORDINAL.get()
+            model = GameDataModel(steam_appid="test", release_date=release)
+
+        assert model.days_since_release == pinned - release.toordinal()
+        assert game_data._TODAY_ORDINAL.get() is None
+
+    def test_low_cardinality_strings_are_interned(self):
+        """Repeated tier/currency/tag values share one str object across models."""
+        first = GameDataModel(
+            steam_appid="1",
+            price_currency="".join(["U", "SD"]),
+            tags=["".join(["Ac", "tion"])],
+        )
+        second = GameDataModel(
+            steam_appid="2",
+            price_currency="".join(["U", "SD"]),
+            tags=["".join(["Ac", "tion"])],
+        )
+
+        assert first.price_currency is second.price_currency
+        assert first.tags[0] is second.tags[0]
@@ -156,6 +156,20 @@ class TestBaseSource:
         assert result.status_code == base.SYNTHETIC_ERROR_CODE
         assert not result.ok
 
+    def test_synthetic_response_mirrors_empty_response(self, base_source_fixture):
+        """Test that the synthetic response exposes the requests.Response subset sources read."""
+        result = base_source_fixture._create_synthetic_response(url="https://x", reason="boom")
+
+        assert result.status_code == base.SYNTHETIC_ERROR_CODE
+        assert result.url == "https://x"
+        assert result.reason == "boom"
+        assert result.text == ""
+        assert result.content == b""
+        assert result.headers == {}
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            result.json()
+        assert base_source_fixture._fetch_and_parse_json(result) is None
+
     def test_make_request_post_with_data_parameter(
         self, mock_request_response, base_source_fixture
     ):
@@ -292,3 +306,120 @@ class TestConnectionPooling:
         assert adapter._pool_connections == 10
         assert adapter._pool_maxsize == 20
         session.close()
+
+    @pytest.mark.parametrize("max_concurrency, pool_maxsize", [(3, 20), (15, 90)])
+    def test_collector_sizes_pool_for_concurrent_fetches(self, max_concurrency, pool_maxsize):
+        """The pool covers every ID-based source of every game in flight."""
+        from gameinsights import Collector
+
+        shared = Collector._create_session()
+        collector = Collector(max_concurrency=max_concurrency)
+        try:
+            adapter = collector._session.get_adapter("https://store.steampowered.com")
+            assert adapter._pool_maxsize == pool_maxsize
+            assert (adapter is shared.get_adapter("https://example.com")) == (pool_maxsize == 20)
+        finally:
+            shared.close()
+            collector.close()
+
+    def test_collectors_on_same_thread_share_adapter(self):
+        """Sessions created on one thread reuse the same HTTPAdapter; other threads get their own."""
+        import threading
+
+        from gameinsights import Collector
+
+        first = Collector._create_session()
+        second = Collector._create_session()
+        other_thread_sessions = []
+        worker = threading.Thread(
+            target=lambda: other_thread_sessions.append(Collector._create_session())
+        )
+        worker.start()
+        worker.join()
+        try:
+            adapter = first.get_adapter("https://example.com")
+            assert second.get_adapter("https://example.com") is adapter
+            assert other_thread_sessions[0].get_adapter("https://example.com") is not adapter
+        finally:
+            for session in (first, second, *other_thread_sessions):
+                session.close()
+
+    def test_closed_collector_leaves_shared_pool_for_the_next_one(self):
+        """Closing a Collector keeps the thread-shared pools; dedicated adapters are closed."""
+        from gameinsights import Collector
+
+        url = "https://store.steampowered.com"
+        with Collector() as first:
+            adapter = first._session.get_adapter(url)
+            pool = adapter.poolmanager.connection_from_url(url)
+
+        with Collector() as second:
+            assert second._session.get_adapter(url) is adapter
+            assert adapter.poolmanager.connection_from_url(url) is pool
+
+        with Collector(max_concurrency=15) as wide:
+            dedicated = wide._session.get_adapter(url)
+            dedicated.poolmanager.connection_from_url(url)
+        assert len(dedicated.poolmanager.pools) == 0
+        assert adapter.poolmanager.connection_from_url(url) is pool
+
+
+class TestLoadsJson:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('{"a": [1, 2.5, "x"]}', {"a": [1, 2.5, "x"]}),
+            (b'{"a": null}', {"a": None}),
+            # 64-bit ids must survive exactly.
+            ('{"steamid": 76561197960287930}', {"steamid": 76561197960287930}),
+        ],
+    )
+    def test_loads_json_matches_stdlib(self, text, expected):
+        from gameinsights.sources._helpers import loads_json
+
+        assert loads_json(text) == expected
+
+    def test_loads_json_falls_back_for_nan_literal(self):
+        import math
+
+        from gameinsights.sources._helpers import loads_json
+
+        assert math.isnan(loads_json('{"v": NaN}')["v"])
+
+    def test_loads_json_raises_stdlib_decode_error(self):
+        import json
+
+        from gameinsights.sources._helpers import loads_json
+
+        with pytest.raises(json.JSONDecodeError):
+            loads_json("{not json")
+
+    def test_response_json_parses_bytes_and_respects_charset(self):
+        from gameinsights.sources._helpers import response_json
+
+        response = requests.Response()
+        response._content = '{"name": "Café"}'.encode("latin-1")
+        response.encoding = "ISO-8859-1"
+        assert response_json(response) == {"name": "Café"}
+
+        response._content = '{"name": "Café"}'.encode()
+        response.encoding = "UTF-8"
+        assert response_json(response) == {"name": "Café"}
+
+
+class TestBuildRequestUrl:
+    @pytest.mark.parametrize("base", ["https://www.protondb.com", "https://steamcharts.com/app/"])
+    @pytest.mark.parametrize(
+        "endpoint",
+        [None, "", "570", "570/", "api/v1/570.json", "/api/v1/570.json", "../up", "?q=1"],
+    )
+    def test_matches_urljoin(self, base, endpoint):
+        from urllib.parse import urljoin
+
+        from gameinsights.sources._helpers import build_request_url
+
+        expected = base.rstrip("/")
+        if endpoint:
+            expected = urljoin(expected + "/", endpoint.rstrip("/"))
+
+        assert build_request_url(base, endpoint) == expected
@@ -112,3 +112,45 @@ class TestHowLongToBeat:
         assert result["success"] is False
         assert "error" in result
         assert result["error"] == "Failed to obtain search token."
+
+    def test_fetch_reuses_cached_search_auth(self, monkeypatch):
+        auth_calls = []
+        auth = _SearchAuth(
+            token="cached", hp_key="hpKey", hp_val="val", user_agent="mock_ua", extras={}
+        )
+
+        def counting_auth(*args, **kwargs):
+            auth_calls.append(1)
+            return auth
+
+        monkeypatch.setattr(HowLongToBeat, "_get_search_auth", counting_auth)
+
+        source = HowLongToBeat()
+        assert source.fetch(game_name="first", verbose=False)["success"] is True
+        assert source.fetch(game_name="second", verbose=False)["success"] is True
+
+        assert len(auth_calls) == 1
+
+    def test_fetch_refreshes_auth_when_search_rejects_token(self, monkeypatch):
+        auths = iter(
+            _SearchAuth(token=token, hp_key="hpKey", hp_val="val", user_agent="ua", extras={})
+            for token in ("stale", "fresh")
+        )
+        used_tokens = []
+
+        class _Response:
+            def __init__(self, status_code):
+                self.status_code = status_code
+                self.text = '{"count": 1, "data": [{"game_id": 1234, "game_name": "Mock"}]}'
+
+        def search(self, game_name, auth):
+            used_tokens.append(auth.token)
+            return _Response(403 if auth.token == "stale" else 200)
+
+        monkeypatch.setattr(HowLongToBeat, "_get_search_auth", lambda self: next(auths))
+        monkeypatch.setattr(HowLongToBeat, "_fetch_search_results", search)
+
+        result = HowLongToBeat().fetch(game_name="mock", verbose=False)
+
+        assert result["success"] is True
+        assert used_tokens == ["stale", "fresh"]
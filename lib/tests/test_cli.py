@@ -1,18 +1,14 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Iterator
+from typing import Any
 
 import pytest
 from tests.fixtures.cli_fixtures import DummyCollector
 
 from gameinsights import cli
 
-
-@pytest.fixture(autouse=True)
-def patched_collector(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
-    monkeypatch.setattr(cli, "Collector", DummyCollector)
-    yield
+pytestmark = pytest.mark.usefixtures("patched_collector")
 
 
 def test_cli_collect_games_with_source_filter(capsys: pytest.CaptureFixture[str]) -> None:
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from gameinsights.utils import cache as cache_module
+from gameinsights.utils.cache import TTLCache
+
+
+def test_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache: TTLCache[str] = TTLCache(maxsize=4, ttl=10)
+
+    cache.set("key", "value")
+    now[0] = 109.0
+    assert cache.get("key") == "value"
+
+    now[0] = 110.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used entry
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+@pytest.mark.parametrize("maxsize, ttl", [(0, 10), (10, 0)])
+def test_rejects_non_positive_bounds(maxsize: int, ttl: float) -> None:
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=maxsize, ttl=ttl)
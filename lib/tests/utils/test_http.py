@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import retry as urllib3_retry
+
+from gameinsights.utils.http import (
+    RETRY_AFTER_MAX,
+    RETRY_STATUS_CODES,
+    create_http_adapter,
+    create_retry,
+)
+
+
+def test_retry_only_retries_transient_statuses() -> None:
+    retry = create_retry()
+
+    assert retry.status == 3
+    assert set(retry.status_forcelist) == set(RETRY_STATUS_CODES)
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("GET", 404)
+    assert not retry.is_retry("POST", 503)
+
+
+def test_retry_leaves_connection_errors_to_make_request() -> None:
+    retry = create_retry()
+
+    # BaseSource._make_request owns connect/read retries; urllib3 must not multiply them.
+    assert retry.connect == 0
+    assert retry.read == 0
+    # Exhausted retries hand back the last response instead of raising.
+    assert retry.raise_on_status is False
+
+
+def test_http_adapter_uses_pool_settings_and_retry() -> None:
+    adapter = create_http_adapter()
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_connections == 10
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.status_forcelist == create_retry().status_forcelist
+
+
+def test_retry_after_wait_is_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _ThrottleOnce(BaseHTTPRequestHandler):
+        calls = 0
+
+        def do_GET(self) -> None:
+            type(self).calls += 1
+            throttled = type(self).calls == 1
+            self.send_response(503 if throttled else 200)
+            if throttled:
+                self.send_header("Retry-After", "3600")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(urllib3_retry.time, "sleep", sleeps.append)
+    server = HTTPServer(("127.0.0.1", 0), _ThrottleOnce)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    session = requests.Session()
+    session.mount("http://", create_http_adapter())
+    try:
+        response = session.get(f"http://127.0.0.1:{server.server_port}/", timeout=5)
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    assert sleeps == [RETRY_AFTER_MAX]
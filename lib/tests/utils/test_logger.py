@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import json
 import logging
+import logging.handlers
+import time
+from unittest.mock import patch
 
 import pytest
 
@@ -78,3 +81,86 @@ def test_metrics_collector_emits_when_enabled(
     assert timer_payload["type"] == "observation"
     assert timer_payload["labels"]["source"] == "steamstore"
     assert timer_payload["value"] >= 0.0
+
+
+def test_logger_wrapper_buffers_until_flush(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GAMEINSIGHTS_LOG_BUFFER", "10")
+    logger = LoggerWrapper("BufferedLogger")
+    logger._logger.handlers.clear()
+    logger._configure_logger()
+
+    messages: list[str] = []
+
+    class CaptureHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            messages.append(record.getMessage())
+
+    buffer = logger._logger.handlers[0]
+    assert isinstance(buffer, logging.handlers.MemoryHandler)
+    buffer.setTarget(CaptureHandler())
+
+    logger.log("fetching 1 of 2", verbose=True)
+    logger.log("fetching 2 of 2", verbose=True)
+    assert messages == []
+
+    logger.flush()
+    assert messages == ["fetching 1 of 2", "fetching 2 of 2"]
+
+    logger.log("source failed", level="error", verbose=True)
+    assert messages[-1] == "source failed"
+
+    logger._logger.handlers.clear()
+
+
+def test_logger_wrapper_defers_positional_args(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GAMEINSIGHTS_LOG_JSON", raising=False)
+    logger = LoggerWrapper("DeferredLogger")
+
+    records: list[logging.LogRecord] = []
+
+    class CaptureHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            records.append(record)
+
+    logger._logger.handlers = [CaptureHandler()]
+    logger._logger.setLevel(logging.INFO)
+
+    logger.log("Fetching %d of %d: appid %s", 1, 2, "570", verbose=True)
+    logger.log("Fetching %d of %d", 2, 2, verbose=True, source="steamstore")
+
+    assert records[0].msg == "Fetching %d of %d: appid %s"
+    assert records[0].getMessage() == "Fetching 1 of 2: appid 570"
+    assert records[1].getMessage() == "Fetching 2 of 2 | source=steamstore"
+
+
+def test_metrics_collector_enabled_flag_overrides_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GAMEINSIGHTS_METRICS", "1")
+    assert MetricsCollector().enabled is True
+    assert MetricsCollector(enabled=False).enabled is False
+
+    monkeypatch.delenv("GAMEINSIGHTS_METRICS")
+    assert MetricsCollector().enabled is False
+    assert MetricsCollector(enabled=True).enabled is True
+
+
+def test_disabled_metrics_timer_measures_without_emitting(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    collector = MetricsCollector(enabled=False)
+
+    with caplog.at_level(logging.INFO, logger="gameinsights.metrics"):
+        with collector.timer("test_timer_seconds", source="steamstore") as timing:
+            time.sleep(0.001)
+
+    assert timing.duration > 0.0
+    assert not [rec for rec in caplog.records if rec.name == "gameinsights.metrics"]
+
+
+def test_enabled_metrics_timer_records_through_observe() -> None:
+    collector = MetricsCollector(enabled=True)
+
+    with patch.object(collector, "observe") as observe:
+        with collector.timer("test_timer_seconds", source="steamstore") as timing:
+            pass
+
+    observe.assert_called_once_with("test_timer_seconds", timing.duration, source="steamstore")
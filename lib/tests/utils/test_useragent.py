@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pytest
+
+from gameinsights.utils import useragent
+
+
+class _CountingUserAgent:
+    instances = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+        self._counter = 0
+
+    @property
+    def random(self) -> str:
+        self._counter += 1
+        return f"agent-{self._counter}"
+
+
+@pytest.fixture
+def fresh_pool(monkeypatch: pytest.MonkeyPatch) -> type[_CountingUserAgent]:
+    _CountingUserAgent.instances = 0
+    monkeypatch.setattr(useragent, "UserAgent", _CountingUserAgent)
+    monkeypatch.setattr(useragent, "_user_agent", None)
+    monkeypatch.setattr(useragent, "_pool", [])
+    return _CountingUserAgent
+
+
+def test_user_agent_database_is_loaded_once(fresh_pool: type[_CountingUserAgent]) -> None:
+    for _ in range(useragent._POOL_SIZE * 2):
+        assert useragent.random_user_agent().startswith("agent-")
+
+    assert fresh_pool.instances == 1
+
+
+def test_pool_stops_growing_once_full(fresh_pool: type[_CountingUserAgent]) -> None:
+    for _ in range(useragent._POOL_SIZE + 10):
+        useragent.random_user_agent()
+
+    assert len(useragent._pool) == useragent._POOL_SIZE
+    assert useragent.random_user_agent() in useragent._pool